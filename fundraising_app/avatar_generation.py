@@ -8,6 +8,9 @@ from typing import Any
 
 import requests
 
+# Shared so repeated generations reuse the keep-alive TLS connection to the image API.
+_HTTP = requests.Session()
+
 _DEFAULT_PROMPT = (
     "A high-resolution, detailed portrait of a random domesticated or farm animal viewed head-on "
     "with a calm, curious expression. The image focuses sharply on the face, showcasing detailed, "
@@ -98,7 +101,7 @@ def generate_avatar_data_url(seed: str, role: str = "profile") -> dict[str, Any]
     }
 
     try:
-        resp = requests.post(
+        resp = _HTTP.post(
             f"{api_base}/images/generations",
             headers=headers,
             json=payload,
@@ -5,22 +5,73 @@ All database operations go through this module.
 """
 
 import os
+import threading
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 from supabase import create_client, Client
 
+# One client per (url, key): its HTTP connection pool keeps PostgREST connections alive across calls.
+_CLIENT_LOCK = threading.Lock()
+_CLIENT: Optional[tuple[tuple[str, str], Client]] = None
+
 
 def get_client() -> Client:
     """Return an authenticated Supabase client using the publishable key.
 
     Uses SUPABASE_PUBLISHABLE_KEY (sb_publishable_...) — the modern,
     recommended key format. Access is governed by RLS policies on each table.
+    The client is created once and shared until the URL or key changes.
     """
+    global _CLIENT
     url = os.environ["SUPABASE_URL"]
     key = os.environ.get("SUPABASE_SERVICE_ROLE_KEY") or os.environ.get("SUPABASE_PUBLISHABLE_KEY")
     if not key:
         raise KeyError("Missing SUPABASE_SERVICE_ROLE_KEY / SUPABASE_PUBLISHABLE_KEY")
-    return create_client(url, key)
+    cached = _CLIENT
+    if cached is not None and cached[0] == (url, key):
+        return cached[1]
+    with _CLIENT_LOCK:
+        if _CLIENT is None or _CLIENT[0] != (url, key):
+            _CLIENT = ((url, key), create_client(url, key))
+        return _CLIENT[1]
+
+
+def _bulk_upsert(table: str, rows: list[dict], conflict_keys: tuple[str, ...], upsert_one,
+                 batch_size: int = 500) -> tuple[list[dict], list[tuple[dict, Exception]]]:
+    """
+    Upsert many rows with one PostgREST request per batch instead of a lookup + write per row.
+    Rows sharing a conflict key are merged first (Postgres rejects touching a row twice in one
+    statement), and rows are grouped by column set so columns a row omits are left untouched
+    rather than overwritten with NULL. A batch that fails is retried row by row with `upsert_one`.
+    Returns (saved_rows, [(row, error), ...]).
+    """
+    merged: dict = {}
+    for index, row in enumerate(rows):
+        key = tuple(row.get(k) for k in conflict_keys)
+        if any(v is None for v in key):
+            key = ("__row__", index)  # NULLs never conflict; keep the row as-is
+        merged[key] = {**merged[key], **row} if key in merged else dict(row)
+
+    groups: dict[frozenset, list[dict]] = {}
+    for row in merged.values():
+        groups.setdefault(frozenset(row), []).append(row)
+
+    client = get_client()
+    saved: list[dict] = []
+    failed: list[tuple[dict, Exception]] = []
+    for group in groups.values():
+        for start in range(0, len(group), batch_size):
+            batch = group[start:start + batch_size]
+            try:
+                result = client.table(table).upsert(batch, on_conflict=",".join(conflict_keys)).execute()
+                saved.extend(result.data or [])
+            except Exception:
+                for row in batch:
+                    try:
+                        saved.append(upsert_one(row))
+                    except Exception as e:
+                        failed.append((row, e))
+    return saved, failed
 
 
 # ──────────────────────────────────────────────
@@ -62,6 +113,14 @@ def upsert_organization(data: dict) -> dict:
     return result.data[0] if result.data else {}
 
 
+def upsert_organizations_bulk(rows: list[dict]) -> tuple[list[dict], list[tuple[dict, Exception]]]:
+    """
+    Insert or update many organizations by name + website (organizations_name_website_unique).
+    Returns (saved_rows, [(row, error), ...]).
+    """
+    return _bulk_upsert("organizations", rows, ("name", "website"), upsert_organization)
+
+
 def get_organizations(min_score: int = 1, limit: int = 500) -> list:
     """Return organizations above a minimum donation potential score."""
     client = get_client()
@@ -111,6 +170,14 @@ def upsert_contact(data: dict) -> dict:
     return result.data[0] if result.data else {}
 
 
+def upsert_contacts_bulk(rows: list[dict]) -> tuple[list[dict], list[tuple[dict, Exception]]]:
+    """
+    Insert or update many contacts by email; contacts without an email are inserted.
+    Returns (saved_rows, [(row, error), ...]).
+    """
+    return _bulk_upsert("contacts", rows, ("email",), upsert_contact)
+
+
 def get_contactable_leads(campaign_id: str, limit: int = 50) -> list:
     """
     Return contacts who:
@@ -20,6 +20,7 @@ _CRM_SCHEMA_CHECKED = False
 _CRM_SCHEMA_AVAILABLE = False
 _DONOR_AVATAR_SUPPORTED: bool | None = None
 _DONOR_FULL_NAME_SUPPORTED: bool | None = None
+_DATA_SOURCE: tuple[tuple, str] | None = None
 _SHORT_CACHE: dict[str, tuple[float, dict]] = {}
 _SHORT_CACHE_TTL_SECONDS = 30
 
@@ -40,12 +41,13 @@ def _cache_get(key: str):
     if time.time() >= expires_at:
         _SHORT_CACHE.pop(key, None)
         return None
-    return payload
+    # Shallow copy: callers (e.g. the API response envelope) add top-level keys to what they get back.
+    return {**payload}
 
 
 def _cache_set(key: str, payload: dict):
     _SHORT_CACHE[key] = (time.time() + _SHORT_CACHE_TTL_SECONDS, payload)
-    return payload
+    return {**payload}
 
 
 def _cache_clear():
@@ -195,7 +197,17 @@ def _refresh_donor_optional_support() -> None:
 
 
 def data_source():
-    return "supabase" if _client() else "mock"
+    """'supabase' or 'mock'; resolved once per Supabase configuration since every response reports it."""
+    global _DATA_SOURCE
+    key = (
+        os.environ.get("SUPABASE_URL"),
+        os.environ.get("SUPABASE_SERVICE_ROLE_KEY"),
+        os.environ.get("SUPABASE_PUBLISHABLE_KEY"),
+    )
+    cached = _DATA_SOURCE
+    if cached is None or cached[0] != key:
+        cached = _DATA_SOURCE = (key, "supabase" if _client() else "mock")
+    return cached[1]
 
 
 def get_explorer_schema_status():
@@ -306,6 +318,46 @@ def _insert(table, payload, *, strict=False):
         return {"id": f"mock-{table}-{int(_now().timestamp())}", "mock": True, **payload}
 
 
+def _insert_many(table, payloads, *, strict=False):
+    """Insert several rows with one request, all-or-nothing.
+
+    Without a client this follows `_insert` (mock rows unless strict). With a client, a failed insert or a
+    response that does not account for every row raises `PersistenceError` instead of returning mock rows.
+    """
+    if not payloads:
+        return []
+    _cache_clear()
+    client = _client()
+    enforce_strict = bool(strict or (supabase_configured() and not _write_fallback_allowed()))
+    stamp = int(_now().timestamp())
+    if not client:
+        if enforce_strict:
+            raise PersistenceError(
+                f"Unable to write to {table}: database client unavailable.",
+                code="db_client_unavailable",
+                hint="Confirm SUPABASE_URL/key are configured and backend can reach Supabase.",
+            )
+        return [{"id": f"mock-{table}-{stamp}-{i}", "mock": True, **payload} for i, payload in enumerate(payloads)]
+    try:
+        result = client.table(table).insert(list(payloads)).execute()
+    except Exception as exc:
+        msg, code, details, hint = _error_text(exc)
+        raise PersistenceError(
+            f"Insert failed for {table}: {msg}",
+            code=code or "db_insert_failed",
+            details=details,
+            hint=hint,
+        ) from exc
+    rows = result.data or []
+    if len(rows) != len(payloads):
+        raise PersistenceError(
+            f"Insert for {table} returned {len(rows)} of {len(payloads)} rows.",
+            code="db_insert_incomplete",
+            hint="Confirm the table's RLS policies allow reading back inserted rows.",
+        )
+    return rows
+
+
 def _update(table, row_id, payload):
     _cache_clear()
     client = _client()
@@ -456,6 +508,14 @@ def _normalize_org_contact(row):
 
 
 def get_fundraising_trends(range_days: int | None = None, start_date: str | None = None, end_date: str | None = None):
+    key = f"fundraising_trends:{range_days}:{start_date}:{end_date}"
+    cached = _cache_get(key)
+    if cached:
+        return cached
+    return _cache_set(key, _build_fundraising_trends(range_days, start_date, end_date))
+
+
+def _build_fundraising_trends(range_days, start_date, end_date):
     if not _client():
         return {"labels": ["Jan", "Feb", "Mar", "Apr", "May", "Jun"], "values": [12000, 18500, 22000, 19500, 25000, 24350], "goal": [23000] * 6, "donations": [45, 67, 82, 71, 95, 89]}
     rows = _fetch("donations", select="amount,donation_date,payment_status", filters=[{"col": "payment_status", "val": "completed"}], order_by="donation_date", limit=2000)
@@ -776,13 +836,16 @@ def get_campaigns(limit=50):
 
 
 def get_active_campaigns():
+    cached = _cache_get("active_campaigns")
+    if cached:
+        return cached
     data = get_campaigns(limit=200)["campaigns"]
     active = [c for c in data if str(c.get("status", "")).lower() == "active"]
-    return {"campaigns": active, "total": len(data)}
+    return _cache_set("active_campaigns", {"campaigns": active, "total": len(data)})
 
 
-def create_campaign(payload):
-    return _insert("campaigns", {
+def _campaign_row(payload):
+    return {
         "name": payload.get("name") or payload.get("title") or "Untitled Campaign",
         "category": payload.get("category") or "general",
         "status": payload.get("status") or "draft",
@@ -790,7 +853,15 @@ def create_campaign(payload):
         "goal_amount": float(payload.get("goal") or payload.get("goal_amount") or 0),
         "start_date": payload.get("start_date"),
         "end_date": payload.get("end_date"),
-    })
+    }
+
+
+def create_campaign(payload):
+    return _insert("campaigns", _campaign_row(payload))
+
+
+def create_campaigns_bulk(payloads):
+    return _insert_many("campaigns", [_campaign_row(p) for p in payloads])
 
 
 def get_campaign_detail(campaign_id):
@@ -852,6 +923,7 @@ def update_campaign(campaign_id, payload):
                     "image_url": update_payload.get("image_url", c.get("image_url")),
                 }}
                 MOCK["campaigns"][idx] = merged
+                _cache_clear()
                 return merged
         return None
 
@@ -869,7 +941,7 @@ def delete_campaign(campaign_id):
     return _delete("campaigns", campaign_id)
 
 
-def get_donors(limit=50, donor_id=None):
+def get_donors(limit=50, donor_id=None, donor_ids=None):
     client = _client()
     if not client:
         if supabase_configured():
@@ -878,13 +950,24 @@ def get_donors(limit=50, donor_id=None):
         rows = MOCK["donors"]
         if donor_id is not None:
             rows = [d for d in rows if str(d["id"]) == str(donor_id)]
+        if donor_ids is not None:
+            wanted = {str(i) for i in donor_ids}
+            rows = [d for d in rows if str(d["id"]) in wanted]
         return {"donors": rows[:limit], "total": len(MOCK["donors"])}
     donor_select = "id,display_name,email,phone,donor_tier,donor_status,total_donated,first_donation_date,last_donation_date,donation_type_preference,engagement_score,notes"
     if _donor_avatar_supported():
         donor_select = f"{donor_select},avatar_url"
     if _donor_full_name_supported():
         donor_select = f"{donor_select},full_name"
-    rows = _fetch("donors", select=donor_select, order_by="updated_at", desc=True, limit=(1 if donor_id else limit), filters=([{"col": "id", "val": donor_id}] if donor_id else None))
+    if donor_id:
+        filters, limit = [{"col": "id", "val": donor_id}], 1
+    elif donor_ids is not None:
+        if not donor_ids:
+            return {"donors": [], "total": 0}
+        filters = [{"col": "id", "op": "in", "val": list(donor_ids)}]
+    else:
+        filters = None
+    rows = _fetch("donors", select=donor_select, order_by="updated_at", desc=True, limit=limit, filters=filters)
     ids = [r["id"] for r in rows]
     tag_rows = _fetch("donor_tag_assignments", select="donor_id,donor_tags(name)", filters=([{"col": "donor_id", "op": "in", "val": ids}] if ids else None), limit=2000)
     tags = defaultdict(list)
@@ -919,6 +1002,8 @@ def get_donors(limit=50, donor_id=None):
             "donation_history": history.get(r["id"], []),
             "donation_count": len(history.get(r["id"], [])),
         })
+    if donor_ids is not None:
+        return {"donors": donors, "total": len(donors)}
     return {"donors": donors, "total": len(_fetch("donors", select="id", limit=1000))}
 
 
@@ -1043,7 +1128,7 @@ def create_donor_note(donor_id, payload):
     return note
 
 
-def create_donor(payload):
+def _donor_row(payload):
     full_name = (payload.get("full_name") or payload.get("name") or "").strip()
     if not full_name:
         first_name = "New"
@@ -1073,9 +1158,13 @@ def create_donor(payload):
         donor_payload["full_name"] = full_name or f"{first_name} {last_name or ''}".strip()
     if _donor_avatar_supported():
         donor_payload["avatar_url"] = payload.get("avatar_url")
-    created = _insert("donors", donor_payload, strict=True)
+    return donor_payload
 
+
+def _created_donor_response(created, payload):
     # Normalize response shape for frontend regardless of data source.
+    full_name = (payload.get("full_name") or payload.get("name") or "").strip()
+    initial_amount = float(payload.get("initial_donation") or payload.get("total_donated") or 0)
     donor_name = created.get("full_name") or created.get("display_name") or " ".join(
         p for p in [created.get("first_name"), created.get("last_name")] if p
     ).strip() or full_name or "New Donor"
@@ -1098,9 +1187,28 @@ def create_donor(payload):
     }
 
 
-def get_animals(limit=50):
+def create_donor(payload):
+    created = _insert("donors", _donor_row(payload), strict=True)
+    return _created_donor_response(created, payload)
+
+
+def create_donors_bulk(payloads):
+    created_rows = _insert_many("donors", [_donor_row(p) for p in payloads], strict=True)
+    return [_created_donor_response(created, payload) for created, payload in zip(created_rows, payloads)]
+
+
+def get_animals(limit=50, animal_ids=None):
     if not _client():
-        return {"animals": MOCK["animals"][:limit], "total": len(MOCK["animals"])}
+        rows = MOCK["animals"]
+        if animal_ids is not None:
+            wanted = {str(i) for i in animal_ids}
+            rows = [a for a in rows if str(a.get("id")) in wanted]
+        return {"animals": rows[:limit], "total": len(MOCK["animals"])}
+    if animal_ids is not None:
+        if not animal_ids:
+            return {"animals": [], "total": 0}
+        rows = _fetch("animals", filters=[{"col": "id", "op": "in", "val": list(animal_ids)}], limit=limit)
+        return {"animals": rows, "total": len(rows)}
     return {"animals": _fetch("animals", order_by="updated_at", desc=True, limit=limit), "total": len(_fetch("animals", select="id", limit=1000))}
 
 
@@ -1120,19 +1228,29 @@ def get_animal_detail(animal_id):
     return animal
 
 
-def create_animal(payload):
-    age_group = _normalize_age_group(payload.get("age_group") or payload.get("age"))
-    data = {
+def _animal_row(payload):
+    return {
         "name": payload.get("name", "Unnamed"),
         "species": payload.get("species", "dog"),
         "breed": payload.get("breed"),
-        "age_group": age_group,
+        "age_group": _normalize_age_group(payload.get("age_group") or payload.get("age")),
         "sex": _normalize_sex(payload.get("sex") or payload.get("gender")),
         "status": payload.get("status", "in_care"),
         "rescue_date": payload.get("rescue_date"),
         "photo_url": payload.get("photo_url"),
         "notes": payload.get("notes"),
     }
+
+
+def _animal_legacy_row(data):
+    # Older schemas may still use image_url instead of photo_url.
+    fallback = {k: v for k, v in data.items() if k != "photo_url"}
+    fallback["image_url"] = data.get("photo_url")
+    return fallback
+
+
+def create_animal(payload):
+    data = _animal_row(payload)
     client = _client()
     if not client:
         return _insert("animals", data)
@@ -1140,15 +1258,27 @@ def create_animal(payload):
         result = client.table("animals").insert(data).execute()
         return (result.data or [{}])[0]
     except Exception as exc:
-        # Older schemas may still use image_url instead of photo_url.
         if "photo_url" in str(exc).lower():
-            fallback = {k: v for k, v in data.items() if k != "photo_url"}
-            fallback["image_url"] = data.get("photo_url")
-            result = client.table("animals").insert(fallback).execute()
+            result = client.table("animals").insert(_animal_legacy_row(data)).execute()
             return (result.data or [{}])[0]
         raise
 
 
+def create_animals_bulk(payloads):
+    rows = [_animal_row(p) for p in payloads]
+    client = _client()
+    if not client or not rows:
+        return _insert_many("animals", rows)
+    _cache_clear()
+    try:
+        result = client.table("animals").insert(rows).execute()
+    except Exception as exc:
+        if "photo_url" not in str(exc).lower():
+            raise
+        result = client.table("animals").insert([_animal_legacy_row(r) for r in rows]).execute()
+    return result.data or [{} for _ in rows]
+
+
 def update_animal(animal_id, payload):
     if not animal_id:
         return None
@@ -1258,8 +1388,8 @@ def get_events(limit=50):
     return {"events": _fetch("events", order_by="starts_at", desc=False, limit=limit), "total": len(_fetch("events", select="id", limit=1000))}
 
 
-def create_event(payload):
-    return _insert("events", {
+def _event_row(payload):
+    return {
         "name": payload.get("name", "Untitled Event"),
         "event_type": payload.get("event_type") or payload.get("type") or "fundraiser",
         "status": payload.get("status") or "planned",
@@ -1268,7 +1398,15 @@ def create_event(payload):
         "ends_at": payload.get("ends_at"),
         "location_name": payload.get("location_name") or payload.get("location"),
         "location_address": payload.get("location_address"),
-    })
+    }
+
+
+def create_event(payload):
+    return _insert("events", _event_row(payload))
+
+
+def create_events_bulk(payloads):
+    return _insert_many("events", [_event_row(p) for p in payloads])
 
 
 def get_stories(limit=50):
@@ -1285,14 +1423,22 @@ def get_story(story_id):
     return rows[0] if rows else None
 
 
-def create_story(payload):
-    return _insert("success_stories", {
+def _story_row(payload):
+    return {
         "title": payload.get("title", "Untitled Story"),
         "status": payload.get("status", "draft"),
         "excerpt": payload.get("excerpt"),
         "body": payload.get("body"),
         "cover_image_url": payload.get("cover_image_url"),
-    })
+    }
+
+
+def create_story(payload):
+    return _insert("success_stories", _story_row(payload))
+
+
+def create_stories_bulk(payloads):
+    return _insert_many("success_stories", [_story_row(p) for p in payloads])
 
 
 def update_story(story_id, payload):
@@ -1458,6 +1604,30 @@ def get_team_member(member_id):
     return _normalize_team_member(rows[0]) if rows else None
 
 
+def count_active_admins():
+    """Number of active administrators, counted by the database rather than by fetching the team.
+
+    A missing status counts as active, as in `_normalize_team_member`. Query errors propagate so callers
+    can report them instead of mistaking them for "no administrators".
+    """
+    client = _client()
+    if not client:
+        return sum(
+            1 for m in MOCK["team"]
+            if str(m.get("role") or "").lower() == "administrator"
+            and str(m.get("status") or "active").lower() == "active"
+        )
+    result = (
+        client.table("team_members")
+        .select("id", count="exact")
+        .ilike("role", "administrator")
+        .or_("status.is.null,status.ilike.active")
+        .limit(1)
+        .execute()
+    )
+    return int(result.count or 0)
+
+
 def invite_team_member(payload):
     created = _insert("team_members", {
         "full_name": payload.get("full_name") or payload.get("name") or "New Team Member",
@@ -1523,16 +1693,22 @@ def update_team_member(member_id, payload):
 
 
 def delete_team_member(member_id):
+    """Disable a team member; returns the disabled member, or None when it does not exist."""
     if not _client():
         for idx, member in enumerate(MOCK["team"]):
             if str(member.get("id")) == str(member_id):
                 updated = {**member, "status": "inactive"}
                 MOCK["team"][idx] = updated
-                return True
-        return False
-    _update("team_members", member_id, {"status": "inactive"})
-    verify = _fetch("team_members", select="id,status", filters=[{"col": "id", "val": member_id}], limit=1)
-    return bool(verify and str((verify[0] or {}).get("status") or "").lower() == "inactive")
+                return _normalize_team_member(updated)
+        return None
+    updated = _update("team_members", member_id, {"status": "inactive"})
+    if "email" in updated and not updated.get("mock"):
+        # The update returned the stored row, so no verification read is needed.
+        return _normalize_team_member(updated)
+    verify = _fetch("team_members", filters=[{"col": "id", "val": member_id}], limit=1)
+    if verify and str((verify[0] or {}).get("status") or "").lower() == "inactive":
+        return _normalize_team_member(verify[0])
+    return None
 
 
 def _map_team_role(role):
@@ -1567,6 +1743,9 @@ def _normalize_team_member(row):
 
 
 def get_recent_updates():
+    cached = _cache_get("recent_updates")
+    if cached:
+        return cached
     if not _client():
         return {"updates": [
             {"id": "story-1", "title": "Max finds forever home!", "category": "Success Story", "time": "2 hours ago", "icon": "story", "page": "stories.html", "record_type": "story", "summary": "Success story published for Max's adoption."},
@@ -1597,10 +1776,13 @@ def get_recent_updates():
         "record_id": e["id"],
         "summary": "Upcoming event update.",
     } for e in events)
-    return {"updates": updates[:6]}
+    return _cache_set("recent_updates", {"updates": updates[:6]})
 
 
 def get_monthly_impact():
+    cached = _cache_get("monthly_impact")
+    if cached:
+        return cached
     total = get_fundraising_total()
     donations = get_recent_donations(limit=500)["donations"]
     now = _now()
@@ -1609,7 +1791,7 @@ def get_monthly_impact():
         dt = _parse_dt(d.get("date"))
         if dt and dt.year == now.year and dt.month == now.month:
             count += 1
-    return {"amount": total["monthly"], "animals_helped": total["animals_helped"], "change_percentage": total["change_percentage"], "donations_count": count}
+    return _cache_set("monthly_impact", {"amount": total["monthly"], "animals_helped": total["animals_helped"], "change_percentage": total["change_percentage"], "donations_count": count})
 
 
 def get_stats_overview():
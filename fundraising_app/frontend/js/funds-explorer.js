@@ -894,7 +894,7 @@ async function importExplorerResults(mode = 'selected') {
   explorerState.importing = true;
   syncExplorerSelectionUI();
   try {
-    const response = await apiJson('/api/explorer/import', {
+    const importResponse = await apiJson('/api/explorer/import', {
       method: 'POST',
       headers: { 'Content-Type': 'application/json' },
       body: JSON.stringify({
@@ -903,6 +903,8 @@ async function importExplorerResults(mode = 'selected') {
         min_score: minScore,
       }),
     });
+    // Large imports are queued as a background job; wait for its result.
+    const response = importResponse.job ? await waitForExplorerJobResult(importResponse.job.job_id) : importResponse;
     const saved = Number(response.saved_count || 0);
     const savedContacts = Number(response.saved_contact_count || 0);
     const requested = Number(response.requested_count || importableRecords.length);
@@ -949,6 +951,16 @@ async function importExplorerResults(mode = 'selected') {
   }
 }
 
+async function waitForExplorerJobResult(jobId, intervalMs = 1500) {
+  for (;;) {
+    await new Promise((resolve) => setTimeout(resolve, intervalMs));
+    const { job } = await apiJson(`/api/explorer/discover/jobs/${encodeURIComponent(jobId)}`, { useCache: false });
+    const status = String(job?.status || '').toLowerCase();
+    if (status === 'completed') return job.result || {};
+    if (status === 'failed') throw new Error(job?.error?.message || job?.message || 'Explorer job failed');
+  }
+}
+
 function stripPreviewOnlyFields(org) {
   const copy = { ...(org || {}) };
   delete copy._preview_key;
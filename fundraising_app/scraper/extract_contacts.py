@@ -44,6 +44,14 @@ PRIORITY_TITLES = [
     "partnerships", "marketing director", "cmo",
 ]
 
+# Compiled once; _find_staff_entries runs them against every element on each scraped page.
+_HTTP_SCHEME_RE = re.compile(r"^https?://", re.I)
+_STAFF_CARD_PATTERNS = (
+    {"class_": re.compile(r"team|staff|person|member|bio|card", re.I)},
+    {"itemtype": re.compile(r"Person", re.I)},
+)
+_STAFF_TITLE_CLASS_RE = re.compile(r"title|role|position|job", re.I)
+
 CONTACT_PAGE_KEYWORDS = [
     "contact", "about", "team", "staff", "leadership",
     "giving", "donate", "philanthropy", "csr", "foundation",
@@ -58,6 +66,9 @@ APOLLO_PREVIEW_PER_ORG_LIMIT = int(os.environ.get("APOLLO_PREVIEW_PER_ORG_LIMIT"
 CONTACT_EXTRACTION_MAX_RUNTIME_SECONDS = float(os.environ.get("CONTACT_EXTRACTION_MAX_RUNTIME_SECONDS", "420"))
 CONTACT_EXTRACTION_STAGE_MAX_SECONDS = float(os.environ.get("CONTACT_EXTRACTION_STAGE_MAX_SECONDS", "180"))
 
+# Apollo calls all go to one host; a shared session keeps the TLS connection alive between them.
+_APOLLO_HTTP = requests.Session()
+
 
 def apollo_configured() -> bool:
     return APOLLO_ENABLED and bool(APOLLO_API_KEY)
@@ -140,7 +151,7 @@ def _domain_from_website(website: str | None) -> str:
     raw = str(website or "").strip()
     if not raw:
         return ""
-    if not re.match(r"^https?://", raw, re.I):
+    if not _HTTP_SCHEME_RE.match(raw):
         raw = f"https://{raw}"
     try:
         host = (urlparse(raw).hostname or "").lower().strip()
@@ -192,7 +203,7 @@ def _apollo_search_people(org: dict, per_org_limit: int = 5) -> list[dict]:
     response_json = None
     for ep in endpoints:
         try:
-            resp = requests.post(
+            resp = _APOLLO_HTTP.post(
                 f"{APOLLO_BASE_URL.rstrip('/')}{ep}",
                 headers=_apollo_headers(),
                 params=params if "api_search" in ep else None,
@@ -286,7 +297,7 @@ def _apollo_maybe_enrich_person(person: dict, domain: str = "") -> dict:
         "reveal_phone_number": False,
     }
     try:
-        resp = requests.post(
+        resp = _APOLLO_HTTP.post(
             f"{APOLLO_BASE_URL.rstrip('/')}/api/v1/people/match",
             headers=_apollo_headers(),
             json=payload,
@@ -401,14 +412,10 @@ def _find_staff_entries(soup) -> list[dict]:
     entries = []
 
     # Pattern 1: Structured team cards (div/article with name + title)
-    card_patterns = [
-        {"class_": re.compile(r"team|staff|person|member|bio|card", re.I)},
-        {"itemtype": re.compile(r"Person", re.I)},
-    ]
-    for pattern in card_patterns:
+    for pattern in _STAFF_CARD_PATTERNS:
         for card in soup.find_all(["div", "article", "li", "section"], **pattern):
             name_tag = card.find(["h2", "h3", "h4", "strong", "b"])
-            title_tag = card.find(["p", "span"], class_=re.compile(r"title|role|position|job", re.I))
+            title_tag = card.find(["p", "span"], class_=_STAFF_TITLE_CLASS_RE)
             if not title_tag:
                 # Try second paragraph/span as title fallback
                 all_text_tags = card.find_all(["p", "span"])
@@ -11,6 +11,7 @@ from __future__ import annotations
 import json
 import os
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Any
 
 import requests
@@ -45,8 +46,30 @@ def _cfg_float(name: str, default: float) -> float:
         return default
 
 
+def _load_config() -> SimpleNamespace:
+    api_key = _cfg("OPENAI_API_KEY", "")
+    return SimpleNamespace(
+        enabled=bool(api_key),
+        api_key=api_key,
+        base=_cfg("OPENAI_API_BASE", "https://api.openai.com/v1").rstrip("/"),
+        model=_cfg("DISCOVERY_LLM_MODEL", "gpt-4.1-mini"),
+        timeout=_cfg_float("DISCOVERY_LLM_TIMEOUT_SECONDS", 12.0),
+        justifications_enabled=_cfg_bool("DISCOVERY_LLM_JUSTIFICATIONS_ENABLED", False),
+    )
+
+
+# LLM settings are read once at import so request setup does no env lookups.
+_LLM = _load_config()
+
+
+def reload_config() -> None:
+    """Re-read LLM settings from the environment (e.g. after tests patch os.environ)."""
+    global _LLM
+    _LLM = _load_config()
+
+
 def llm_enabled() -> bool:
-    return bool(_cfg("OPENAI_API_KEY", ""))
+    return _LLM.enabled
 
 
 def plan_source_types(criteria: dict[str, Any]) -> dict[str, Any]:
@@ -127,7 +150,7 @@ def plan_source_types(criteria: dict[str, Any]) -> dict[str, Any]:
 
 def org_justification(org: dict[str, Any], criteria: dict[str, Any]) -> dict[str, str]:
     """Natural language justification + additional info for an organization candidate."""
-    if llm_enabled() and _cfg_bool("DISCOVERY_LLM_JUSTIFICATIONS_ENABLED", False):
+    if _LLM.enabled and _LLM.justifications_enabled:
         try:
             prompt = {
                 "task": "Explain why this source may be a donor prospect for an animal welfare nonprofit, based on the provided signals.",
@@ -406,11 +429,11 @@ def _score_100(score: Any) -> int:
 
 def _openai_json_request(payload: dict[str, Any]) -> dict[str, Any]:
     headers = {
-        "Authorization": f"Bearer {_cfg('OPENAI_API_KEY', '')}",
+        "Authorization": f"Bearer {_LLM.api_key}",
         "Content-Type": "application/json",
     }
     body = {
-        "model": _cfg("DISCOVERY_LLM_MODEL", "gpt-4.1-mini"),
+        "model": _LLM.model,
         "messages": [
             {"role": "system", "content": "You are a fundraising prospecting assistant. Return valid JSON only."},
             {"role": "user", "content": json.dumps(payload)},
@@ -419,10 +442,10 @@ def _openai_json_request(payload: dict[str, Any]) -> dict[str, Any]:
         "response_format": {"type": "json_object"},
     }
     resp = requests.post(
-        f"{_cfg('OPENAI_API_BASE', 'https://api.openai.com/v1').rstrip('/')}/chat/completions",
+        f"{_LLM.base}/chat/completions",
         headers=headers,
         json=body,
-        timeout=(5, _cfg_float("DISCOVERY_LLM_TIMEOUT_SECONDS", 12.0)),
+        timeout=(5, _LLM.timeout),
     )
     resp.raise_for_status()
     data = resp.json() or {}
@@ -3,16 +3,28 @@ scraper/utils.py
 Shared utilities: rate limiting, robots.txt checking, HTML helpers.
 """
 
+import json
 import time
 import random
 import logging
 import math
+import os
 import re
+import threading
+from pathlib import Path
 from urllib.parse import urlparse, urljoin
 from urllib.robotparser import RobotFileParser
 
 import requests
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import lxml  # noqa: F401  (pinned in requirements.txt; parses pages several times faster than html.parser)
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
 logger = logging.getLogger(__name__)
@@ -26,6 +38,33 @@ HEADERS = {
 
 SESSION = requests.Session()
 SESSION.headers.update(HEADERS)
+# Contact extraction scrapes several sites at once; keep a pooled connection per host for each of them,
+# and retry idempotent requests once or twice on dropped connections and gateway errors.
+_SESSION_ADAPTER = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=16,
+    max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=(502, 503, 504), raise_on_status=False),
+)
+SESSION.mount("http://", _SESSION_ADAPTER)
+SESSION.mount("https://", _SESSION_ADAPTER)
+
+# Geocodes rarely change and Nominatim allows ~1 req/s, so successful lookups are
+# memoized in memory and persisted to a runtime file shared across runs.
+GEOCODE_CACHE_PATH = Path(__file__).resolve().parents[1] / ".runtime_geocode_cache.json"
+GEOCODE_CACHE_TTL_SECONDS = 30 * 86400
+_GEOCODE_CACHE_LOCK = threading.Lock()
+_GEOCODE_CACHE: dict[str, dict] | None = None
+
+# Parsed robots.txt per origin, so the homepage and each subpage of a site share one fetch.
+# Entries expire so a long-running server picks up robots.txt changes between discovery runs.
+ROBOTS_CACHE_TTL_SECONDS = 3600
+_ROBOTS_CACHE_MAX_ENTRIES = 1024
+_ROBOTS_CACHE_LOCK = threading.Lock()
+_ROBOTS_CACHE: dict[str, tuple[float, RobotFileParser | None]] = {}
+
+# Compiled once; these run over the full text of every scraped page.
+EMAIL_RE = re.compile(r"[a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}")
+PHONE_RE = re.compile(r"(\+?1[-.\s]?)?(\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4})")
 
 
 STATE_ABBR = {
@@ -78,15 +117,71 @@ def parse_search_location(value: str | None) -> dict:
     return parsed
 
 
+def _geocode_cache_key(query: str) -> str:
+    return re.sub(r"\s+", " ", query).strip().lower()
+
+
+def _load_geocode_cache() -> dict[str, dict]:
+    global _GEOCODE_CACHE
+    if _GEOCODE_CACHE is None:
+        try:
+            data = json.loads(GEOCODE_CACHE_PATH.read_text(encoding="utf-8"))
+            _GEOCODE_CACHE = data if isinstance(data, dict) else {}
+        except Exception:
+            _GEOCODE_CACHE = {}
+    return _GEOCODE_CACHE
+
+
+def _geocode_entry_fresh(entry, now: float) -> bool:
+    if not isinstance(entry, dict) or not isinstance(entry.get("result"), dict):
+        return False
+    try:
+        return float(entry.get("cached_at") or 0) + GEOCODE_CACHE_TTL_SECONDS >= now
+    except (TypeError, ValueError):
+        return False
+
+
+def _geocode_cache_get(key: str) -> dict | None:
+    with _GEOCODE_CACHE_LOCK:
+        entry = _load_geocode_cache().get(key)
+    if not _geocode_entry_fresh(entry, time.time()):
+        return None
+    return entry["result"]
+
+
+def _geocode_cache_set(key: str, result: dict) -> None:
+    now = time.time()
+    with _GEOCODE_CACHE_LOCK:
+        cache = _load_geocode_cache()
+        # Drop expired or malformed entries so the runtime file cannot grow without bound.
+        for stale_key in [k for k, v in cache.items() if not _geocode_entry_fresh(v, now)]:
+            cache.pop(stale_key, None)
+        cache[key] = {"cached_at": now, "result": result}
+        # Write a temp file and swap it in, so a crash mid-write never leaves a truncated cache behind.
+        tmp_path = GEOCODE_CACHE_PATH.with_name(f"{GEOCODE_CACHE_PATH.name}.{os.getpid()}.tmp")
+        try:
+            tmp_path.write_text(json.dumps(cache), encoding="utf-8")
+            os.replace(tmp_path, GEOCODE_CACHE_PATH)
+        except Exception as e:
+            logger.debug(f"Unable to persist geocode cache: {e}")
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+
 def geocode_location(location_query: str | None) -> dict | None:
     """
     Geocode a location string using Nominatim (OpenStreetMap).
     Returns {latitude, longitude, display_name} or None.
+    Successful lookups are cached on disk for 30 days.
     Best-effort only; callers should gracefully fall back to text matching.
     """
     query = (location_query or "").strip()
     if not query:
         return None
+    cache_key = _geocode_cache_key(query)
+    cached = _geocode_cache_get(cache_key)
+    if cached:
+        return dict(cached)
     try:
         resp = SESSION.get(
             "https://nominatim.openstreetmap.org/search",
@@ -98,7 +193,7 @@ def geocode_location(location_query: str | None) -> dict | None:
         if not rows:
             return None
         row = rows[0]
-        return {
+        result = {
             "latitude": float(row["lat"]),
             "longitude": float(row["lon"]),
             "display_name": row.get("display_name"),
@@ -106,6 +201,8 @@ def geocode_location(location_query: str | None) -> dict | None:
     except Exception as e:
         logger.warning(f"Geocode failed for '{query}': {e}")
         return None
+    _geocode_cache_set(cache_key, result)
+    return dict(result)
 
 
 def haversine_miles(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
@@ -134,6 +231,26 @@ def within_radius_miles(origin: dict | None, lat: float | None, lon: float | Non
         return False
 
 
+def _robots_for(origin: str) -> RobotFileParser | None:
+    """Return the parsed robots.txt for `scheme://host`, or None if it could not be read."""
+    now = time.time()
+    with _ROBOTS_CACHE_LOCK:
+        cached = _ROBOTS_CACHE.get(origin)
+    if cached and cached[0] > now:
+        return cached[1]
+    rp = RobotFileParser()
+    rp.set_url(f"{origin}/robots.txt")
+    try:
+        rp.read()
+    except Exception:
+        rp = None  # unreachable robots.txt is remembered too, instead of retried for every page
+    with _ROBOTS_CACHE_LOCK:
+        if len(_ROBOTS_CACHE) >= _ROBOTS_CACHE_MAX_ENTRIES:
+            _ROBOTS_CACHE.clear()
+        _ROBOTS_CACHE[origin] = (now + ROBOTS_CACHE_TTL_SECONDS, rp)
+    return rp
+
+
 def can_fetch(url: str) -> bool:
     """
     Check robots.txt to see if our bot is allowed to fetch the URL.
@@ -141,10 +258,9 @@ def can_fetch(url: str) -> bool:
     """
     try:
         parsed = urlparse(url)
-        robots_url = f"{parsed.scheme}://{parsed.netloc}/robots.txt"
-        rp = RobotFileParser()
-        rp.set_url(robots_url)
-        rp.read()
+        rp = _robots_for(f"{parsed.scheme}://{parsed.netloc}")
+        if rp is None:
+            return True  # if we can't read robots.txt, proceed cautiously
         return rp.can_fetch(HEADERS["User-Agent"], url)
     except Exception:
         return True  # if we can't read robots.txt, proceed cautiously
@@ -162,7 +278,7 @@ def fetch_page(url: str, timeout: int = 15) -> BeautifulSoup | None:
         polite_delay()
         resp = SESSION.get(url, timeout=timeout, allow_redirects=True)
         resp.raise_for_status()
-        return BeautifulSoup(resp.text, "html.parser")
+        return BeautifulSoup(resp.text, HTML_PARSER)
     except requests.RequestException as e:
         logger.warning(f"Failed to fetch {url}: {e}")
         return None
@@ -170,7 +286,6 @@ def fetch_page(url: str, timeout: int = 15) -> BeautifulSoup | None:
 
 def extract_emails_from_soup(soup: BeautifulSoup) -> list[str]:
     """Extract all mailto: email addresses from a parsed page."""
-    import re
     emails = set()
 
     # mailto links
@@ -183,8 +298,7 @@ def extract_emails_from_soup(soup: BeautifulSoup) -> list[str]:
 
     # Plain-text email pattern
     text = soup.get_text()
-    pattern = r"[a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}"
-    for match in re.findall(pattern, text):
+    for match in EMAIL_RE.findall(text):
         emails.add(match.lower())
 
     # Filter out image/asset false positives
@@ -196,10 +310,7 @@ def extract_emails_from_soup(soup: BeautifulSoup) -> list[str]:
 
 def extract_phone_from_soup(soup: BeautifulSoup) -> str | None:
     """Extract the first phone number found on a page."""
-    import re
-    text = soup.get_text()
-    pattern = r"(\+?1[-.\s]?)?(\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4})"
-    match = re.search(pattern, text)
+    match = PHONE_RE.search(soup.get_text())
     return match.group(0).strip() if match else None
 
 
@@ -0,0 +1,79 @@
+"""
+Write precompressed copies of the frontend's text assets for the dashboard server.
+
+For each HTML/JS/CSS/SVG file under frontend/, writes `<file>.gz` (gzip, level 9) and, when the
+optional `brotli` package is installed, `<file>.br` (quality 11). `server.py` serves these variants
+to clients that accept the encoding, so nothing is compressed per request.
+
+Run after changing frontend files and before (re)starting the server; the server looks variants up
+once per process. Outputs are skipped when already newer than their source, and stale variants whose
+source was deleted are removed.
+"""
+
+from __future__ import annotations
+
+import gzip
+import sys
+from pathlib import Path
+
+try:
+    import brotli
+except ImportError:  # optional: gzip variants are still written
+    brotli = None
+
+APP_ROOT = Path(__file__).resolve().parents[1]
+FRONTEND_ROOT = APP_ROOT / "frontend"
+COMPRESSIBLE_SUFFIXES = frozenset({".html", ".js", ".css", ".svg"})
+# Tiny files gain nothing once the Content-Encoding header is counted.
+MIN_SIZE_BYTES = 1024
+
+
+def _compressors():
+    compressors = [(".gz", lambda data: gzip.compress(data, compresslevel=9, mtime=0))]
+    if brotli is not None:
+        compressors.append((".br", lambda data: brotli.compress(data, quality=11)))
+    return compressors
+
+
+def _remove_orphans() -> int:
+    removed = 0
+    for variant in list(FRONTEND_ROOT.rglob("*.gz")) + list(FRONTEND_ROOT.rglob("*.br")):
+        if not variant.with_suffix("").exists():
+            variant.unlink()
+            removed += 1
+    return removed
+
+
+def main() -> int:
+    compressors = _compressors()
+    written = skipped = 0
+    for source in sorted(FRONTEND_ROOT.rglob("*")):
+        if not source.is_file() or source.suffix.lower() not in COMPRESSIBLE_SUFFIXES:
+            continue
+        stat = source.stat()
+        if stat.st_size < MIN_SIZE_BYTES:
+            continue
+        data = None
+        for suffix, compress in compressors:
+            target = source.with_name(source.name + suffix)
+            if target.exists() and target.stat().st_mtime >= stat.st_mtime:
+                skipped += 1
+                continue
+            if data is None:
+                data = source.read_bytes()
+            compressed = compress(data)
+            if len(compressed) >= len(data):
+                target.unlink(missing_ok=True)
+                continue
+            target.write_bytes(compressed)
+            written += 1
+
+    removed = _remove_orphans()
+    print(f"Precompressed frontend assets: {written} written, {skipped} up to date, {removed} stale removed")
+    if brotli is None:
+        print("brotli not installed; wrote gzip variants only (pip install brotli for .br)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -13,14 +13,17 @@ if str(APP_ROOT) not in sys.path:
 if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
-load_dotenv(APP_ROOT / ".env")
-
 from avatar_generation import regenerate_existing_avatars
 
 
 def main() -> int:
+    env_path = APP_ROOT / ".env"
+    if env_path.exists():
+        load_dotenv(env_path, override=False)
     result = regenerate_existing_avatars()
-    print(json.dumps(result, indent=2))
+    # Stream the report to stdout instead of building the whole string first.
+    json.dump(result, sys.stdout, indent=2)
+    sys.stdout.write("\n")
     return 0
 
 
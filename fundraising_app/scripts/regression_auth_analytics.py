@@ -4,8 +4,8 @@ Regression checks for auth/session boundaries and analytics custom-range support
 Runs with Flask test client (no network server required).
 """
 
+import copy
 import sys
-import tempfile
 from pathlib import Path
 
 ROOT = Path(__file__).resolve().parents[2]
@@ -13,12 +13,20 @@ if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
 
+_RESULTS: list[tuple[bool, str]] = []
+
+
 def _assert(condition: bool, message: str):
-    if condition:
-        print(f"PASS {message}")
-        return 0
-    print(f"FAIL {message}")
-    return 1
+    # Results are collected and written once at the end instead of printing per check.
+    ok = bool(condition)
+    _RESULTS.append((ok, message))
+    return 0 if ok else 1
+
+
+def _flush_results() -> None:
+    if _RESULTS:
+        sys.stdout.write("\n".join(f"{'PASS' if ok else 'FAIL'} {message}" for ok, message in _RESULTS) + "\n")
+        _RESULTS.clear()
 
 
 def main() -> int:
@@ -29,18 +37,28 @@ def main() -> int:
 
     failed = 0
 
-    orig_auth_store_path = server._AUTH_STORE_PATH
+    orig_load_auth_accounts_indexed = server._load_auth_accounts_indexed
+    orig_save_auth_accounts = server._save_auth_accounts
     orig_bootstrap_token = server._AUTH_BOOTSTRAP_TOKEN
     orig_crm_client = server.crm._client
 
-    temp_dir = tempfile.TemporaryDirectory()
+    # The checks need no durability, so the auth store lives in memory instead of a temp JSON file.
+    # Copies keep the file store's semantics: callers get fresh objects and must save to persist.
+    auth_accounts: list[dict] = []
+
+    def load_auth_accounts_indexed() -> tuple[list[dict], dict[str, int]]:
+        accounts = copy.deepcopy(auth_accounts)
+        return accounts, server._auth_email_index(accounts)
+
+    def save_auth_accounts(accounts: list[dict]) -> None:
+        auth_accounts[:] = copy.deepcopy(accounts)
+
     try:
-        server._AUTH_STORE_PATH = Path(temp_dir.name) / "auth_accounts.json"
+        server._load_auth_accounts_indexed = load_auth_accounts_indexed
+        server._save_auth_accounts = save_auth_accounts
         server._AUTH_BOOTSTRAP_TOKEN = "regression-bootstrap-token"
         server.crm._client = lambda: None
         server._AUTH_SESSIONS.clear()
-        if server._AUTH_STORE_PATH.exists():
-            server._AUTH_STORE_PATH.unlink()
 
         client = server.app.test_client()
 
@@ -66,9 +84,10 @@ def main() -> int:
         failed += _assert(session_resp.status_code == 200, "/api/auth/session responds 200 after bootstrap")
         failed += _assert(bool(session.get("authenticated")), "session is authenticated after bootstrap")
 
-        donors_unauth = server.app.test_client().get("/api/donors")
+        anon_client = server.app.test_client()
+        donors_unauth = anon_client.get("/api/donors")
         failed += _assert(donors_unauth.status_code == 401, "unauthenticated user blocked from /api/donors")
-        campaigns_public = server.app.test_client().get("/api/campaigns")
+        campaigns_public = anon_client.get("/api/campaigns")
         failed += _assert(campaigns_public.status_code == 200, "public access remains enabled for /api/campaigns")
 
         trends_range = client.get("/api/fundraising/trends?range=30")
@@ -76,14 +95,16 @@ def main() -> int:
         failed += _assert(trends_range.status_code == 200, "analytics trends range query succeeds")
         failed += _assert(trends_custom.status_code == 200, "analytics trends custom date query succeeds")
 
-        analytics_js = (ROOT / "fundraising_app" / "frontend" / "js" / "analytics-charts.js").read_text(encoding="utf-8")
-        failed += _assert("function buildTrendsUrl()" in analytics_js, "frontend analytics builds trends URL dynamically")
-        failed += _assert("analyticsCustomRangeModal" in analytics_js, "frontend analytics custom-range modal is present")
+        # Raw bytes are enough for marker checks and skip decoding the whole bundle.
+        analytics_js = (ROOT / "fundraising_app" / "frontend" / "js" / "analytics-charts.js").read_bytes()
+        failed += _assert(b"function buildTrendsUrl()" in analytics_js, "frontend analytics builds trends URL dynamically")
+        failed += _assert(b"analyticsCustomRangeModal" in analytics_js, "frontend analytics custom-range modal is present")
     finally:
-        server._AUTH_STORE_PATH = orig_auth_store_path
+        server._load_auth_accounts_indexed = orig_load_auth_accounts_indexed
+        server._save_auth_accounts = orig_save_auth_accounts
         server._AUTH_BOOTSTRAP_TOKEN = orig_bootstrap_token
         server.crm._client = orig_crm_client
-        temp_dir.cleanup()
+        _flush_results()
 
     return 0 if failed == 0 else 1
 
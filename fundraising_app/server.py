@@ -10,22 +10,28 @@ from __future__ import annotations
 
 import io
 import json
+import mimetypes
 import os
+import queue
 import secrets
 import smtplib
 import sys
 import threading
+import time
 import traceback
 import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from email.message import EmailMessage
-from functools import wraps
+from functools import lru_cache, wraps
 from pathlib import Path
+from types import SimpleNamespace
 
-from flask import Flask, g, jsonify, make_response, request, send_from_directory
+from flask import Flask, g, jsonify, make_response, request, send_from_directory, url_for
 from flask_cors import CORS
 from dotenv import load_dotenv
-from werkzeug.security import check_password_hash, generate_password_hash
+from werkzeug.security import check_password_hash, generate_password_hash, safe_join
 
 # Load local app env file for both `python server.py` and package imports.
 load_dotenv(Path(__file__).resolve().parent / ".env")
@@ -35,17 +41,15 @@ try:
 except ModuleNotFoundError:  # pragma: no cover - import fallback
     from .db import crm  # when importing as `fundraising_app.server`
 
-try:
-    from scraper.discover import run_discovery as run_scraper_discovery, import_discovery_results
-except ModuleNotFoundError:  # pragma: no cover - import fallback
-    from .scraper.discover import run_discovery as run_scraper_discovery, import_discovery_results
-
 try:
     from avatar_generation import generate_avatar_data_url, regenerate_existing_avatars
 except ModuleNotFoundError:  # pragma: no cover - import fallback
     from .avatar_generation import generate_avatar_data_url, regenerate_existing_avatars
 
 app = Flask(__name__, static_folder="frontend")
+# API clients never rely on key order or indentation, so skip sorting and pretty-printing (even in debug).
+app.json.sort_keys = False
+app.json.compact = True
 _cors_allowed_origins = [
     o.strip() for o in str(
         os.environ.get(
@@ -54,81 +58,220 @@ _cors_allowed_origins = [
         )
     ).split(",") if o.strip()
 ]
+# Normalized once for the CSRF origin check that runs on every API write.
+_TRUSTED_ORIGINS = frozenset(o.rstrip("/") for o in _cors_allowed_origins)
 CORS(
     app,
     resources={r"/api/*": {"origins": _cors_allowed_origins}},
     supports_credentials=True,
+    # Let browsers reuse a preflight result for a day instead of re-asking per request.
+    max_age=86400,
 )
 
 _EXPLORER_JOB_LOCK = threading.Lock()
 _EXPLORER_JOBS: dict[str, dict] = {}
+# Discovery jobs share a bounded pool; extra jobs wait in the executor queue with status "queued".
+_EXPLORER_MAX_WORKERS = max(1, int(str(os.environ.get("EXPLORER_MAX_WORKERS") or "4").strip() or "4"))
+_EXPLORER_POOL = ThreadPoolExecutor(max_workers=_EXPLORER_MAX_WORKERS, thread_name_prefix="explorer-job")
 _AUTH_LOCK = threading.Lock()
 _AUTH_SESSIONS: dict[str, dict] = {}
-_RATE_LIMIT_LOCK = threading.Lock()
-_RATE_LIMIT_BUCKETS: dict[str, list[float]] = {}
+# Token buckets: bucket key -> (tokens remaining, last refill timestamp, timestamp it is full again). Buckets
+# are striped across several locks so concurrent writers from different clients do not serialize on one mutex.
+# A full bucket behaves exactly like a missing one, so each stripe periodically drops those.
+_RATE_LIMIT_STRIPE_COUNT = 16
+_RATE_LIMIT_STRIPES: tuple[tuple[threading.Lock, dict[str, tuple[float, float, float]]], ...] = tuple(
+    (threading.Lock(), {}) for _ in range(_RATE_LIMIT_STRIPE_COUNT)
+)
+_RATE_LIMIT_STRIPES_SWEPT_AT = [0.0] * _RATE_LIMIT_STRIPE_COUNT
 _AUTH_STORE_PATH = Path(__file__).resolve().parent / ".runtime_auth_accounts.json"
+# Parsed auth store and its email -> position index, keyed by (path, mtime_ns, size) so unchanged files
+# are not re-read per request.
+_AUTH_ACCOUNTS_CACHE: tuple[tuple, list[dict], dict[str, int]] | None = None
 _AUTH_SESSION_TTL_SECONDS = 60 * 60 * 12
+_AUTH_SESSION_REFRESH_SECONDS = 60
+# Expired sessions and finished explorer jobs are swept opportunistically, at most once per interval.
+_STATE_SWEEP_INTERVAL_SECONDS = 60 * 5
+_EXPLORER_JOB_RETENTION_SECONDS = 60 * 60 * 6
+# Job results with more organizations than this are streamed rather than encoded in one piece.
+_EXPLORER_STREAM_MIN_ORGANIZATIONS = 200
+# Imports with more records than this run as background explorer jobs instead of inside the request.
+_EXPLORER_IMPORT_ASYNC_THRESHOLD = 100
+_AUTH_SESSIONS_SWEPT_AT = 0.0
+_EXPLORER_JOBS_SWEPT_AT = 0.0
 _AUTH_COOKIE_NAME = "funds_auth_token"
+_AUTH_COOKIE_SECURE = str(os.environ.get("AUTH_COOKIE_SECURE", "false")).strip().lower() in {"1", "true", "yes"}
 _FALLBACK_NOTIFICATION_EMAIL = "admin@localhost.localdomain"
 _AUTH_BOOTSTRAP_TOKEN = str(os.environ.get("AUTH_BOOTSTRAP_TOKEN") or "").strip()
-_ADOPTION_REQUESTS_PATH = Path(__file__).resolve().parent / ".runtime_adoption_requests.json"
-_HELP_REQUESTS_PATH = Path(__file__).resolve().parent / ".runtime_help_requests.json"
+# Public submissions are appended as JSON Lines; files are compacted to the newest records when they grow.
+# Older `.runtime_*_requests.json` list files are converted on the first append (see _migrate_legacy_runtime_records).
+_ADOPTION_REQUESTS_PATH = Path(__file__).resolve().parent / ".runtime_adoption_requests.jsonl"
+_HELP_REQUESTS_PATH = Path(__file__).resolve().parent / ".runtime_help_requests.jsonl"
+_RUNTIME_RECORDS_LOCK = threading.Lock()
+_RUNTIME_RECORDS_KEEP = 500
+_RUNTIME_RECORDS_COMPACT_BYTES = 2 * 1024 * 1024
+# Notification emails are sent by one background worker so SMTP latency never holds a request thread.
+_EMAIL_QUEUE: queue.Queue = queue.Queue()
+_EMAIL_WORKER_LOCK = threading.Lock()
+_EMAIL_WORKER: threading.Thread | None = None
+# Provider-generated avatars by (seed, role); bounded because each entry is a base64 PNG.
+_AVATAR_CACHE: dict[tuple[str, str], dict] = {}
+_AVATAR_CACHE_LOCK = threading.Lock()
+_AVATAR_CACHE_MAX_ENTRIES = 128
+# Optional werkzeug hash method override (e.g. a cheap pbkdf2 setting for local smoke runs).
+_PASSWORD_HASH_METHOD = str(os.environ.get("AUTH_PASSWORD_HASH_METHOD") or "").strip() or None
+# Opt-in: re-hash a password on successful login when it was stored with a different method or cost.
+_PASSWORD_REHASH_ON_LOGIN = str(os.environ.get("AUTH_PASSWORD_REHASH_ON_LOGIN") or "").strip().lower() in {"1", "true", "yes"}
+
+
+def _utc_now() -> datetime:
+    return datetime.now(timezone.utc)
 
 
 def _utc_now_iso() -> str:
-    return datetime.now(timezone.utc).isoformat()
+    return _utc_now().isoformat()
 
 
 def _utc_now_ts() -> float:
-    return datetime.now(timezone.utc).timestamp()
+    return _utc_now().timestamp()
 
 
-def _append_adoption_request(record: dict) -> None:
+def _write_text_atomic(path: Path, text: str) -> None:
+    # Write beside the target and swap it in, so a crash mid-write never leaves a truncated file.
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
     try:
-        if _ADOPTION_REQUESTS_PATH.exists():
-            current = json.loads(_ADOPTION_REQUESTS_PATH.read_text(encoding="utf-8"))
-            rows = current if isinstance(current, list) else []
-        else:
-            rows = []
-    except Exception:
-        rows = []
-    rows.insert(0, record)
+        tmp_path.write_text(text, encoding="utf-8")
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def _migrate_legacy_runtime_records(path: Path) -> None:
+    """Convert submissions stored before the JSONL format (`<name>.json`, a newest-first list) into `path`."""
+    legacy_path = path.with_suffix(".json")
+    if path.exists() or not legacy_path.exists():
+        return
+    rows = json.loads(legacy_path.read_text(encoding="utf-8"))
+    lines = [
+        json.dumps(row, separators=(",", ":"), default=str) + "\n"
+        for row in reversed(rows if isinstance(rows, list) else [])
+        if isinstance(row, dict)
+    ]
+    _write_text_atomic(path, "".join(lines))
+    # Keep the original beside the new file rather than deleting submissions.
+    legacy_path.replace(legacy_path.with_name(legacy_path.name + ".migrated"))
+
+
+def _append_runtime_record(path: Path, record: dict) -> None:
+    line = json.dumps(record, separators=(",", ":"), default=str) + "\n"
     try:
-        _ADOPTION_REQUESTS_PATH.write_text(json.dumps(rows[:500], indent=2), encoding="utf-8")
+        with _RUNTIME_RECORDS_LOCK:
+            _migrate_legacy_runtime_records(path)
+            with path.open("a", encoding="utf-8") as fh:
+                fh.write(line)
+                size = fh.tell()
+            if size > _RUNTIME_RECORDS_COMPACT_BYTES:
+                with path.open("r", encoding="utf-8") as fh:
+                    newest = deque(fh, maxlen=_RUNTIME_RECORDS_KEEP)
+                _write_text_atomic(path, "".join(newest))
     except Exception:
-        pass
+        app.logger.exception("Unable to store public submission in %s", path.name)
+
+
+def _append_adoption_request(record: dict) -> None:
+    _append_runtime_record(_ADOPTION_REQUESTS_PATH, record)
 
 
 def _append_help_request(record: dict) -> None:
+    _append_runtime_record(_HELP_REQUESTS_PATH, record)
+
+
+def _load_smtp_config() -> SimpleNamespace:
+    def env(name: str, default: str = "") -> str:
+        return str(os.environ.get(name) or default).strip()
+
+    sender_email = env("SENDER_EMAIL")
+    return SimpleNamespace(
+        host=env("SMTP_HOST"),
+        port=int(env("SMTP_PORT", "587") or "587"),
+        username=env("SMTP_USERNAME"),
+        password=env("SMTP_PASSWORD"),
+        use_tls=env("SMTP_USE_TLS", "true").lower() not in {"0", "false", "no"},
+        from_email=env("SMTP_FROM_EMAIL") or sender_email,
+        adoption_to=env("ADOPTION_REQUEST_TO_EMAIL") or sender_email or _FALLBACK_NOTIFICATION_EMAIL,
+        help_to=env("HELP_REQUEST_TO_EMAIL") or env("ADOPTION_REQUEST_TO_EMAIL") or sender_email or _FALLBACK_NOTIFICATION_EMAIL,
+    )
+
+
+# SMTP settings are read once at import so sending an email does no env lookups.
+_SMTP = _load_smtp_config()
+
+
+def _reload_smtp_config() -> None:
+    """Re-read SMTP settings from the environment (e.g. after tests patch os.environ)."""
+    global _SMTP
+    _SMTP = _load_smtp_config()
+
+
+# One SMTP connection is kept open between notification emails and reopened when idle or dropped.
+_SMTP_CONNECTION_LOCK = threading.Lock()
+_SMTP_CONNECTION: smtplib.SMTP | None = None
+_SMTP_CONNECTION_USED_AT = 0.0
+_SMTP_CONNECTION_IDLE_SECONDS = 60
+
+
+def _smtp_close_quietly(smtp: smtplib.SMTP | None) -> None:
+    if smtp is None:
+        return
     try:
-        if _HELP_REQUESTS_PATH.exists():
-            current = json.loads(_HELP_REQUESTS_PATH.read_text(encoding="utf-8"))
-            rows = current if isinstance(current, list) else []
-        else:
-            rows = []
-    except Exception:
-        rows = []
-    rows.insert(0, record)
-    try:
-        _HELP_REQUESTS_PATH.write_text(json.dumps(rows[:500], indent=2), encoding="utf-8")
+        smtp.quit()
     except Exception:
-        pass
+        try:
+            smtp.close()
+        except Exception:
+            pass
+
+
+def _smtp_send_message(cfg: SimpleNamespace, msg: EmailMessage) -> None:
+    global _SMTP_CONNECTION, _SMTP_CONNECTION_USED_AT
+    with _SMTP_CONNECTION_LOCK:
+        smtp = _SMTP_CONNECTION
+        _SMTP_CONNECTION = None
+        if smtp is not None and time.monotonic() - _SMTP_CONNECTION_USED_AT > _SMTP_CONNECTION_IDLE_SECONDS:
+            _smtp_close_quietly(smtp)
+            smtp = None
+        for attempt in range(2):
+            if smtp is None:
+                smtp = smtplib.SMTP(cfg.host, cfg.port, timeout=20)
+                try:
+                    if cfg.use_tls:
+                        smtp.starttls()
+                    if cfg.username:
+                        smtp.login(cfg.username, cfg.password)
+                except Exception:
+                    _smtp_close_quietly(smtp)
+                    raise
+            try:
+                smtp.send_message(msg)
+                break
+            except smtplib.SMTPServerDisconnected:
+                # A pooled connection the server already dropped; reconnect once and resend.
+                _smtp_close_quietly(smtp)
+                smtp = None
+                if attempt:
+                    raise
+            except Exception:
+                _smtp_close_quietly(smtp)
+                raise
+        _SMTP_CONNECTION = smtp
+        _SMTP_CONNECTION_USED_AT = time.monotonic()
 
 
 def _send_adoption_request_email(record: dict) -> tuple[bool, str]:
-    target = (
-        str(os.environ.get("ADOPTION_REQUEST_TO_EMAIL") or "").strip()
-        or str(os.environ.get("SENDER_EMAIL") or "").strip()
-        or _FALLBACK_NOTIFICATION_EMAIL
-    )
-    smtp_host = str(os.environ.get("SMTP_HOST") or "").strip()
-    smtp_port = int(str(os.environ.get("SMTP_PORT") or "587").strip() or "587")
-    smtp_user = str(os.environ.get("SMTP_USERNAME") or "").strip()
-    smtp_pass = str(os.environ.get("SMTP_PASSWORD") or "").strip()
-    smtp_use_tls = str(os.environ.get("SMTP_USE_TLS") or "true").strip().lower() not in {"0", "false", "no"}
-    from_email = str(os.environ.get("SMTP_FROM_EMAIL") or os.environ.get("SENDER_EMAIL") or target).strip()
-
-    if not smtp_host:
+    cfg = _SMTP
+    target = cfg.adoption_to
+    from_email = cfg.from_email or target
+
+    if not cfg.host:
         return False, f"SMTP_HOST not configured; request logged for {target}"
 
     subject = f"Adoption Request: {record.get('animal_name') or 'Animal'}"
@@ -149,32 +292,18 @@ def _send_adoption_request_email(record: dict) -> tuple[bool, str]:
     msg.set_content(body)
 
     try:
-        with smtplib.SMTP(smtp_host, smtp_port, timeout=20) as smtp:
-            if smtp_use_tls:
-                smtp.starttls()
-            if smtp_user:
-                smtp.login(smtp_user, smtp_pass)
-            smtp.send_message(msg)
+        _smtp_send_message(cfg, msg)
         return True, f"Sent to {target}"
     except Exception as exc:
         return False, f"Email send failed; request logged for {target}: {exc}"
 
 
 def _send_help_request_email(record: dict) -> tuple[bool, str]:
-    target = (
-        str(os.environ.get("HELP_REQUEST_TO_EMAIL") or "").strip()
-        or str(os.environ.get("ADOPTION_REQUEST_TO_EMAIL") or "").strip()
-        or str(os.environ.get("SENDER_EMAIL") or "").strip()
-        or _FALLBACK_NOTIFICATION_EMAIL
-    )
-    smtp_host = str(os.environ.get("SMTP_HOST") or "").strip()
-    smtp_port = int(str(os.environ.get("SMTP_PORT") or "587").strip() or "587")
-    smtp_user = str(os.environ.get("SMTP_USERNAME") or "").strip()
-    smtp_pass = str(os.environ.get("SMTP_PASSWORD") or "").strip()
-    smtp_use_tls = str(os.environ.get("SMTP_USE_TLS") or "true").strip().lower() not in {"0", "false", "no"}
-    from_email = str(os.environ.get("SMTP_FROM_EMAIL") or os.environ.get("SENDER_EMAIL") or target).strip()
-
-    if not smtp_host:
+    cfg = _SMTP
+    target = cfg.help_to
+    from_email = cfg.from_email or target
+
+    if not cfg.host:
         return False, f"SMTP_HOST not configured; request logged for {target}"
 
     req_type = str(record.get("request_type") or "help").lower()
@@ -202,17 +331,35 @@ def _send_help_request_email(record: dict) -> tuple[bool, str]:
     msg.set_content("\n".join(body_lines))
 
     try:
-        with smtplib.SMTP(smtp_host, smtp_port, timeout=20) as smtp:
-            if smtp_use_tls:
-                smtp.starttls()
-            if smtp_user:
-                smtp.login(smtp_user, smtp_pass)
-            smtp.send_message(msg)
+        _smtp_send_message(cfg, msg)
         return True, f"Sent to {target}"
     except Exception as exc:
         return False, f"Email send failed; request logged for {target}: {exc}"
 
 
+def _email_worker() -> None:
+    while True:
+        send, record = _EMAIL_QUEUE.get()
+        try:
+            sent, message = send(record)
+            if not sent:
+                print(f"Notification email for {record.get('id')} not sent: {message}", file=sys.stderr)
+        except Exception as exc:
+            print(f"Notification email for {record.get('id')} failed: {exc}", file=sys.stderr)
+        finally:
+            _EMAIL_QUEUE.task_done()
+
+
+def _queue_notification_email(send, record: dict) -> None:
+    global _EMAIL_WORKER
+    with _EMAIL_WORKER_LOCK:
+        # Started on first use so importing the server (tests, scripts) spawns no threads.
+        if _EMAIL_WORKER is None or not _EMAIL_WORKER.is_alive():
+            _EMAIL_WORKER = threading.Thread(target=_email_worker, name="notification-email", daemon=True)
+            _EMAIL_WORKER.start()
+    _EMAIL_QUEUE.put((send, record))
+
+
 def _client_ip() -> str:
     fwd = request.headers.get("X-Forwarded-For") or ""
     if fwd:
@@ -220,17 +367,25 @@ def _client_ip() -> str:
     return request.remote_addr or "unknown"
 
 
-def _rate_limit_allow(bucket: str, *, limit: int, window_seconds: int) -> bool:
-    now = _utc_now_ts()
-    lower = now - float(window_seconds)
-    with _RATE_LIMIT_LOCK:
-        timestamps = [ts for ts in _RATE_LIMIT_BUCKETS.get(bucket, []) if ts >= lower]
-        if len(timestamps) >= int(limit):
-            _RATE_LIMIT_BUCKETS[bucket] = timestamps
-            return False
-        timestamps.append(now)
-        _RATE_LIMIT_BUCKETS[bucket] = timestamps
-    return True
+def _rate_limit_allow(bucket: str, *, limit: int, window_seconds: int, now: float | None = None) -> bool:
+    if now is None:
+        now = _utc_now_ts()
+    capacity = float(limit)
+    refill_per_second = capacity / float(window_seconds)
+    stripe = hash(bucket) % _RATE_LIMIT_STRIPE_COUNT
+    lock, buckets = _RATE_LIMIT_STRIPES[stripe]
+    with lock:
+        if now - _RATE_LIMIT_STRIPES_SWEPT_AT[stripe] >= _STATE_SWEEP_INTERVAL_SECONDS:
+            _RATE_LIMIT_STRIPES_SWEPT_AT[stripe] = now
+            for key in [key for key, state in buckets.items() if state[2] <= now]:
+                del buckets[key]
+        tokens, last_refill, _ = buckets.get(bucket, (capacity, now, now))
+        tokens = min(capacity, tokens + (now - last_refill) * refill_per_second)
+        allowed = tokens >= 1.0
+        if allowed:
+            tokens -= 1.0
+        buckets[bucket] = (tokens, now, now + (capacity - tokens) / refill_per_second)
+    return allowed
 
 
 def _is_trusted_origin(origin: str) -> bool:
@@ -240,7 +395,7 @@ def _is_trusted_origin(origin: str) -> bool:
     host_origin = request.host_url.rstrip("/")
     if value == host_origin:
         return True
-    return value in set(_cors_allowed_origins)
+    return value in _TRUSTED_ORIGINS
 
 
 def _auth_role_rank(role: str) -> int:
@@ -252,6 +407,10 @@ def _auth_role_rank(role: str) -> int:
     return 1
 
 
+_AUTH_RANK_MEMBER = _auth_role_rank("member")
+_AUTH_RANK_ADMIN = _auth_role_rank("administrator")
+
+
 def _auth_normalize_role(role: str) -> str:
     key = str(role or "visitor").lower().strip()
     if key in {"admin", "administrator"}:
@@ -261,6 +420,30 @@ def _auth_normalize_role(role: str) -> str:
     return "visitor"
 
 
+def _hash_password(password: str) -> str:
+    if _PASSWORD_HASH_METHOD:
+        return generate_password_hash(password, method=_PASSWORD_HASH_METHOD)
+    return generate_password_hash(password)
+
+
+def _verify_password(password_hash: str, password: str) -> bool:
+    return check_password_hash(str(password_hash or ""), str(password or ""))
+
+
+def _password_needs_rehash(password_hash: str) -> bool:
+    if not _PASSWORD_REHASH_ON_LOGIN or not _PASSWORD_HASH_METHOD:
+        return False
+    # Werkzeug hashes look like "method$salt$hash"; the method carries the cost parameters
+    # ("scrypt:32768:8:1", "pbkdf2:sha256:600000"), and a bare configured "scrypt" matches any cost.
+    stored_method = str(password_hash or "").split("$", 1)[0]
+    return not (stored_method == _PASSWORD_HASH_METHOD or stored_method.startswith(_PASSWORD_HASH_METHOD + ":"))
+
+
+def _looks_like_email(email: str) -> bool:
+    local, at, domain = email.partition("@")
+    return bool(local and at and "." in domain)
+
+
 def _validate_password_strength(password: str) -> tuple[bool, str]:
     raw = str(password or "")
     if len(raw) < 8:
@@ -273,7 +456,33 @@ def _validate_password_strength(password: str) -> tuple[bool, str]:
     return True, ""
 
 
+def _auth_store_key() -> tuple | None:
+    try:
+        stat = _AUTH_STORE_PATH.stat()
+    except OSError:
+        return None
+    return (str(_AUTH_STORE_PATH), stat.st_mtime_ns, stat.st_size)
+
+
+def _auth_email_index(accounts: list[dict]) -> dict[str, int]:
+    index: dict[str, int] = {}
+    for i, account in enumerate(accounts):
+        # First match wins, as with the previous linear scans.
+        index.setdefault(str(account.get("email") or "").strip().lower(), i)
+    return index
+
+
 def _load_auth_accounts() -> list[dict]:
+    return _load_auth_accounts_indexed()[0]
+
+
+def _load_auth_accounts_indexed() -> tuple[list[dict], dict[str, int]]:
+    global _AUTH_ACCOUNTS_CACHE
+    key = _auth_store_key()
+    cached = _AUTH_ACCOUNTS_CACHE
+    if key is not None and cached is not None and cached[0] == key:
+        # Callers mutate what they get back before saving, so hand out per-account copies.
+        return [dict(account) for account in cached[1]], cached[2]
     try:
         if _AUTH_STORE_PATH.exists():
             data = json.loads(_AUTH_STORE_PATH.read_text(encoding="utf-8"))
@@ -303,10 +512,16 @@ def _load_auth_accounts() -> list[dict]:
             changed = True
     if changed:
         _save_auth_accounts(accounts)
-    return accounts
+        key = _auth_store_key()
+    index = _auth_email_index(accounts)
+    if key is not None:
+        _AUTH_ACCOUNTS_CACHE = (key, [dict(account) for account in accounts], index)
+    return accounts, index
 
 
 def _save_auth_accounts(accounts: list[dict]) -> None:
+    global _AUTH_ACCOUNTS_CACHE
+    _AUTH_ACCOUNTS_CACHE = None
     try:
         _AUTH_STORE_PATH.write_text(json.dumps(accounts, indent=2), encoding="utf-8")
     except Exception:
@@ -317,18 +532,17 @@ def _find_auth_account(email: str) -> dict | None:
     target = str(email or "").strip().lower()
     if not target:
         return None
-    for account in _load_auth_accounts():
-        if str(account.get("email") or "").strip().lower() == target:
-            return account
-    return None
+    accounts, index = _load_auth_accounts_indexed()
+    idx = index.get(target)
+    return accounts[idx] if idx is not None else None
 
 
 def _upsert_auth_account(payload: dict) -> dict:
-    accounts = _load_auth_accounts()
+    accounts, index = _load_auth_accounts_indexed()
     email = str(payload.get("email") or "").strip().lower()
     if not email:
         raise ValueError("Email is required")
-    idx = next((i for i, a in enumerate(accounts) if str(a.get("email") or "").lower() == email), -1)
+    idx = index.get(email, -1)
     existing = accounts[idx] if idx >= 0 else {}
     merged = {
         "id": payload.get("id") or existing.get("id") or f"acct-{uuid.uuid4().hex[:10]}",
@@ -349,7 +563,7 @@ def _upsert_auth_account(payload: dict) -> dict:
         ok, message = _validate_password_strength(str(password))
         if not ok:
             raise ValueError(message)
-        merged["password_hash"] = generate_password_hash(str(password))
+        merged["password_hash"] = _hash_password(str(password))
     else:
         existing_hash = existing.get("password_hash")
         if existing_hash:
@@ -367,30 +581,41 @@ def _upsert_auth_account(payload: dict) -> dict:
 
 
 def _change_auth_password(email: str, current_password: str, new_password: str, *, admin_override: bool = False) -> tuple[bool, str]:
-    accounts = _load_auth_accounts()
+    accounts, index = _load_auth_accounts_indexed()
     target = str(email or "").strip().lower()
-    idx = next((i for i, a in enumerate(accounts) if str(a.get("email") or "").lower() == target), -1)
+    idx = index.get(target, -1)
     if idx < 0:
         return False, "Account not found."
     acct = accounts[idx]
     if not admin_override:
-        if not check_password_hash(str(acct.get("password_hash") or ""), str(current_password or "")):
+        if not _verify_password(acct.get("password_hash"), current_password):
             return False, "Current password is incorrect."
     ok, message = _validate_password_strength(str(new_password))
     if not ok:
         return False, message
-    acct["password_hash"] = generate_password_hash(str(new_password))
+    acct["password_hash"] = _hash_password(str(new_password))
     acct["updated_at"] = _utc_now_iso()
     accounts[idx] = acct
     _save_auth_accounts(accounts)
     return True, "Password updated."
 
 
+def _sweep_expired_auth_sessions(now: float) -> None:
+    # Caller holds _AUTH_LOCK. Abandoned tokens are otherwise only dropped when presented again.
+    global _AUTH_SESSIONS_SWEPT_AT
+    if now - _AUTH_SESSIONS_SWEPT_AT < _STATE_SWEEP_INTERVAL_SECONDS:
+        return
+    _AUTH_SESSIONS_SWEPT_AT = now
+    expired = [token for token, session in _AUTH_SESSIONS.items() if float(session.get("expires_at_ts") or 0) < now]
+    for token in expired:
+        _AUTH_SESSIONS.pop(token, None)
+
+
 def _issue_auth_session(account: dict) -> dict:
     token = secrets.token_urlsafe(32)
     session = {
         "token": token,
-        "email": str(account.get("email") or "").lower(),
+        "email": str(account.get("email") or "").strip().lower(),
         "full_name": account.get("full_name") or account.get("email"),
         "role": _auth_normalize_role(account.get("role")),
         "status": str(account.get("status") or "active").lower(),
@@ -400,6 +625,7 @@ def _issue_auth_session(account: dict) -> dict:
         "expires_at_ts": _utc_now_ts() + _AUTH_SESSION_TTL_SECONDS,
     }
     with _AUTH_LOCK:
+        _sweep_expired_auth_sessions(_utc_now_ts())
         _AUTH_SESSIONS[token] = session
     return session
 
@@ -414,20 +640,26 @@ def _get_bearer_token() -> str | None:
     return None
 
 
-def _get_auth_session_from_request() -> dict | None:
+def _get_auth_session_from_request(now: float | None = None) -> dict | None:
     token = _get_bearer_token()
     if not token:
         return None
-    with _AUTH_LOCK:
-        session = _AUTH_SESSIONS.get(token)
-        if not session:
-            return None
-        if float(session.get("expires_at_ts") or 0) < _utc_now_ts():
+    # Reads are lock-free (dict.get is atomic); the lock is only taken to evict an expired session or to
+    # slide its expiry, which is refreshed at most once per _AUTH_SESSION_REFRESH_SECONDS.
+    session = _AUTH_SESSIONS.get(token)
+    if not session:
+        return None
+    if now is None:
+        now = _utc_now_ts()
+    expires_at = float(session.get("expires_at_ts") or 0)
+    if expires_at < now:
+        with _AUTH_LOCK:
             _AUTH_SESSIONS.pop(token, None)
-            return None
-        session["expires_at_ts"] = _utc_now_ts() + _AUTH_SESSION_TTL_SECONDS
-        _AUTH_SESSIONS[token] = session
-        return {**session}
+        return None
+    if expires_at - now < _AUTH_SESSION_TTL_SECONDS - _AUTH_SESSION_REFRESH_SECONDS:
+        with _AUTH_LOCK:
+            session["expires_at_ts"] = now + _AUTH_SESSION_TTL_SECONDS
+    return {**session}
 
 
 def _auth_public_session_payload(session: dict | None) -> dict:
@@ -447,6 +679,8 @@ def _auth_public_session_payload(session: dict | None) -> dict:
 
 
 def _require_auth(min_role: str = "member"):
+    min_rank = _auth_role_rank(min_role)
+
     def decorator(fn):
         @wraps(fn)
         def wrapper(*args, **kwargs):
@@ -455,7 +689,7 @@ def _require_auth(min_role: str = "member"):
                 return _json_error("Authentication required", 401)
             if str(session.get("status") or "active").lower() != "active":
                 return _json_error("Account is not active", 403)
-            if _auth_role_rank(session.get("role")) < _auth_role_rank(min_role):
+            if g.auth_rank < min_rank:
                 return _json_error("Insufficient permissions", 403)
             return fn(*args, **kwargs)
         return wrapper
@@ -493,7 +727,7 @@ def _sync_team_member_to_auth_store(member_payload: dict, *, password: str | Non
 def _auth_bootstrap_needed() -> bool:
     accounts = _load_auth_accounts()
     for account in accounts:
-        if _auth_role_rank(account.get("role")) >= _auth_role_rank("administrator"):
+        if _auth_role_rank(account.get("role")) >= _AUTH_RANK_ADMIN:
             if str(account.get("status") or "active").lower() == "active":
                 return False
     return True
@@ -503,40 +737,130 @@ def _avatar_seed(email: str, name: str, role: str, record_id: str | None = None)
     return f"{str(email or '').strip().lower()}|{str(name or '').strip()}|{str(role or '').strip().lower()}|{str(record_id or '').strip()}"
 
 
-def _explorer_job_snapshot(job_id: str):
+def _generate_avatar(seed: str, role: str) -> dict:
+    """`generate_avatar_data_url` with provider results reused for a repeated (seed, role).
+
+    The fallback SVG is cheap to rebuild and may stand in for a transient provider failure, so it is not cached.
+    """
+    key = (seed, role)
+    cached = _AVATAR_CACHE.get(key)
+    if cached is not None:
+        return cached
+    generated = generate_avatar_data_url(seed=seed, role=role)
+    if generated.get("provider") != "fallback-svg":
+        with _AVATAR_CACHE_LOCK:
+            while len(_AVATAR_CACHE) >= _AVATAR_CACHE_MAX_ENTRIES:
+                _AVATAR_CACHE.pop(next(iter(_AVATAR_CACHE)), None)
+            _AVATAR_CACHE[key] = generated
+    return generated
+
+
+def _sweep_finished_explorer_jobs(now: float) -> None:
+    # Caller holds _EXPLORER_JOB_LOCK. Finished jobs are kept long enough for clients to fetch results.
+    global _EXPLORER_JOBS_SWEPT_AT
+    if now - _EXPLORER_JOBS_SWEPT_AT < _STATE_SWEEP_INTERVAL_SECONDS:
+        return
+    _EXPLORER_JOBS_SWEPT_AT = now
+    cutoff = now - _EXPLORER_JOB_RETENTION_SECONDS
+    stale = []
+    for job_id, job in _EXPLORER_JOBS.items():
+        if job.get("status") not in {"completed", "failed"} or not job.get("finished_at"):
+            continue
+        try:
+            finished_ts = datetime.fromisoformat(str(job["finished_at"])).timestamp()
+        except ValueError:
+            continue
+        if finished_ts < cutoff:
+            stale.append(job_id)
+    for job_id in stale:
+        _EXPLORER_JOBS.pop(job_id, None)
+
+
+# Fields a poll needs while a job is still running; the result, request payload and last raw progress
+# event are only returned once the job has finished.
+_EXPLORER_JOB_SUMMARY_KEYS = (
+    "job_id",
+    "job_type",
+    "status",
+    "progress",
+    "step",
+    "message",
+    "created_at",
+    "updated_at",
+    "started_at",
+    "finished_at",
+    "error",
+)
+
+
+# Progress event keys copied onto the job itself; anything else is kept under job["event"].
+_PROGRESS_EVENT_FIELDS = frozenset({"message", "status", "step", "progress"})
+
+
+def _explorer_job_snapshot(job_id: str, *, summary: bool = False):
+    """Point-in-time view of a job. Finished jobs are never updated again, so their stored dict is
+    returned as-is and callers must treat it as read-only; running jobs are copied under the lock."""
     with _EXPLORER_JOB_LOCK:
         job = _EXPLORER_JOBS.get(job_id)
         if not job:
             return None
+        if job.get("status") in {"completed", "failed"}:
+            return job
+        if summary:
+            return {key: job[key] for key in _EXPLORER_JOB_SUMMARY_KEYS if key in job}
         return {**job}
 
 
-def _update_explorer_job(job_id: str, **updates):
+def _update_explorer_job(job_id: str, **updates) -> None:
+    updates["updated_at"] = _utc_now_iso()
     with _EXPLORER_JOB_LOCK:
         job = _EXPLORER_JOBS.get(job_id)
-        if not job:
-            return None
-        job.update(updates)
-        job["updated_at"] = _utc_now_iso()
-        return {**job}
+        if job:
+            job.update(updates)
 
 
-def _start_explorer_discovery_job(payload: dict) -> dict:
-    job_id = f"explr-{uuid.uuid4().hex[:12]}"
+def _register_explorer_job(job_type: str, message: str, payload: dict) -> dict:
+    job_id = f"explr-{secrets.token_hex(6)}"
     job = {
         "job_id": job_id,
-        "job_type": "funds_explorer_discovery",
+        "job_type": job_type,
         "status": "queued",
         "progress": 0,
         "step": "queued",
-        "message": "Discovery job queued.",
+        "message": message,
         "created_at": _utc_now_iso(),
         "updated_at": _utc_now_iso(),
         "started_at": None,
         "finished_at": None,
         "error": None,
         "result": None,
-        "payload": {
+        "payload": payload,
+    }
+    with _EXPLORER_JOB_LOCK:
+        _sweep_finished_explorer_jobs(_utc_now_ts())
+        _EXPLORER_JOBS[job_id] = job
+    # The stored dict belongs to the worker from here on; callers get the queued state.
+    return {**job}
+
+
+def _scraper_discover():
+    """Import the discovery pipeline on first use.
+
+    It pulls in feedparser and the scraper helpers, which only the Funds Explorer endpoints need, so the
+    server can start answering health checks and dashboard reads without paying for that import.
+    """
+    try:
+        from scraper import discover  # when running `python server.py` from fundraising_app/
+    except ModuleNotFoundError:  # pragma: no cover - import fallback
+        from .scraper import discover  # when importing as `fundraising_app.server`
+    return discover
+
+
+def _start_explorer_discovery_job(payload: dict) -> dict:
+    job = _register_explorer_job(
+        "funds_explorer_discovery",
+        "Discovery job queued.",
+        {
             "location": payload.get("location"),
             "radius_miles": payload.get("radius_miles"),
             "limit": payload.get("limit"),
@@ -546,24 +870,25 @@ def _start_explorer_discovery_job(payload: dict) -> dict:
             "exclude_record_keys_count": len(payload.get("exclude_record_keys") or []),
             "extract_contacts": bool(payload.get("extract_contacts", True)),
         },
-    }
-    with _EXPLORER_JOB_LOCK:
-        _EXPLORER_JOBS[job_id] = job
+    )
+    job_id = job["job_id"]
 
     def progress_cb(event: dict):
-        _update_explorer_job(
-            job_id,
-            status=str(event.get("status") or "running"),
-            step=str(event.get("step") or "running"),
-            message=str(event.get("message") or ""),
-            progress=int(event.get("progress", _EXPLORER_JOBS.get(job_id, {}).get("progress", 0) or 0)) if event.get("progress") is not None else _EXPLORER_JOBS.get(job_id, {}).get("progress", 0),
-            event={k: v for k, v in event.items() if k not in {"message", "status", "step", "progress"}},
-        )
+        updates = {
+            "status": str(event.get("status") or "running"),
+            "step": str(event.get("step") or "running"),
+            "message": str(event.get("message") or ""),
+            "event": {k: event[k] for k in event.keys() - _PROGRESS_EVENT_FIELDS},
+        }
+        # Events without a progress value leave the last reported progress in place.
+        if event.get("progress") is not None:
+            updates["progress"] = int(event["progress"])
+        _update_explorer_job(job_id, **updates)
 
     def worker():
         _update_explorer_job(job_id, status="running", step="starting", message="Starting discovery pipeline...", progress=1, started_at=_utc_now_iso())
         try:
-            result = run_scraper_discovery(
+            result = _scraper_discover().run_discovery(
                 location=payload.get("location"),
                 radius_miles=payload.get("radius_miles"),
                 limit=payload.get("limit", 50),
@@ -595,19 +920,114 @@ def _start_explorer_discovery_job(payload: dict) -> dict:
                 finished_at=_utc_now_iso(),
             )
 
-    threading.Thread(target=worker, name=f"explorer-job-{job_id}", daemon=True).start()
+    _EXPLORER_POOL.submit(worker)
     return job
 
 
-def _json_ok(payload: dict, status: int = 200):
-    payload.setdefault("meta", {})
-    payload["meta"].update(
-        {
-            "data_source": crm.data_source(),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-        }
+def _start_explorer_import_job(records: list, *, extract_contacts: bool, min_score) -> dict:
+    job = _register_explorer_job(
+        "funds_explorer_import",
+        "Import job queued.",
+        {"records_count": len(records), "extract_contacts": extract_contacts, "min_score": min_score},
     )
-    return jsonify(payload), status
+    job_id = job["job_id"]
+
+    def worker():
+        _update_explorer_job(job_id, status="running", step="importing", message=f"Importing {len(records)} records...", progress=1, started_at=_utc_now_iso())
+        try:
+            result = _scraper_discover().import_discovery_results(records, extract_contacts=extract_contacts, min_score=min_score)
+            _update_explorer_job(
+                job_id,
+                status="completed",
+                step="complete",
+                message=str((result or {}).get("saved_count", 0)) + " organizations imported.",
+                progress=100,
+                finished_at=_utc_now_iso(),
+                result=result,
+            )
+        except Exception as exc:
+            _update_explorer_job(
+                job_id,
+                status="failed",
+                step="error",
+                message=f"Import job failed: {exc}",
+                error={"message": str(exc), "traceback": traceback.format_exc(limit=5)},
+                finished_at=_utc_now_iso(),
+            )
+
+    _EXPLORER_POOL.submit(worker)
+    return job
+
+
+def _with_response_meta(payload: dict) -> dict:
+    payload.setdefault("meta", {})
+    payload["meta"]["data_source"] = crm.data_source()
+    if not g.get("omit_response_timestamp"):
+        payload["meta"]["timestamp"] = _utc_now_iso()
+    return payload
+
+
+# Opt-in shared caching for unauthenticated read endpoints (e.g. behind a CDN); 0 keeps every response revalidated.
+_PUBLIC_API_CACHE_SECONDS = max(0, int(str(os.environ.get("PUBLIC_API_CACHE_SECONDS") or "0").strip() or "0"))
+
+
+def _conditional_get(fn=None, *, public: bool = False):
+    """Tag successful GET responses with a strong ETag and answer matching If-None-Match with 304.
+
+    Responses from these endpoints leave the per-request timestamp out of `meta` so unchanged data
+    produces an identical body (and ETag); the HTTP Date header still carries the time. Routes marked
+    `public=True` serve the same data to everyone and may be cached by shared caches for
+    PUBLIC_API_CACHE_SECONDS when that is set.
+    """
+    if fn is None:
+        return lambda f: _conditional_get(f, public=public)
+
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        if request.method != "GET":
+            return fn(*args, **kwargs)
+        g.omit_response_timestamp = True
+        response = app.make_response(fn(*args, **kwargs))
+        if response.status_code == 200 and not response.is_streamed:
+            if public and _PUBLIC_API_CACHE_SECONDS:
+                response.headers["Cache-Control"] = (
+                    f"public, max-age={_PUBLIC_API_CACHE_SECONDS}, "
+                    f"stale-while-revalidate={_PUBLIC_API_CACHE_SECONDS * 2}"
+                )
+            else:
+                # Always revalidate, and keep per-user data out of shared caches.
+                response.cache_control.private = True
+                response.cache_control.no_cache = True
+            response.add_etag()
+            response.make_conditional(request)
+        return response
+
+    return wrapper
+
+
+def _json_ok(payload: dict, status: int = 200):
+    return jsonify(_with_response_meta(payload)), status
+
+
+def _json_ok_streamed(payload: dict, container: dict, key: str, status: int = 200):
+    """Like `_json_ok`, but streams the list at `container[key]` (a dict inside `payload`) item by item.
+
+    The envelope is encoded with a placeholder in place of the list, so the client starts receiving
+    bytes before every item is encoded and no single string holds the whole response.
+    """
+    items = container.get(key) or []
+    placeholder = f"__stream_{secrets.token_hex(8)}__"
+    container[key] = placeholder
+    head, tail = app.json.dumps(_with_response_meta(payload)).split(app.json.dumps(placeholder), 1)
+    dumps = app.json.dumps
+
+    def generate():
+        yield head + "["
+        for i, item in enumerate(items):
+            yield ("," if i else "") + dumps(item)
+        yield "]" + tail + "\n"
+
+    return app.response_class(generate(), status=status, mimetype=app.json.mimetype)
 
 
 def _json_error(
@@ -628,6 +1048,40 @@ def _json_error(
     return jsonify(payload), status
 
 
+def _query_int(name: str, default: int, *, minimum: int = 1, maximum: int = 1000) -> int:
+    """Read an integer query arg, falling back to `default` on bad input and clamping to [minimum, maximum]."""
+    raw = request.args.get(name)
+    try:
+        value = int(raw) if raw else default
+    except ValueError:
+        value = default
+    return max(minimum, min(value, maximum))
+
+
+_BATCH_LOOKUP_MAX_IDS = 200
+
+
+def _query_ids(name: str = "ids") -> list[str] | None:
+    """Comma-separated ids from the query string (deduplicated, capped), or None when the arg is absent."""
+    raw = request.args.get(name)
+    if raw is None:
+        return None
+    ids = dict.fromkeys(part.strip() for part in raw.split(",") if part.strip())
+    return list(ids)[:_BATCH_LOOKUP_MAX_IDS]
+
+
+def _rows_by_id(rows: list[dict], ids: list[str]) -> dict:
+    found = {str(row.get("id")): row for row in rows}
+    return {record_id: found.get(record_id) for record_id in ids}
+
+
+def _member_payload():
+    """Guard for member-only writes on routes that also serve public reads; returns (payload, error_response)."""
+    if g.auth_rank < _AUTH_RANK_MEMBER:
+        return None, _json_error("Authentication required", 401)
+    return request.get_json(silent=True) or {}, None
+
+
 def _exception_parts(exc: Exception) -> tuple[str, str | None, str | None, str | None]:
     msg = str(getattr(exc, "args", [None])[0] or str(exc) or "Operation failed").strip()
     code = getattr(exc, "code", None)
@@ -642,40 +1096,93 @@ def _json_from_exception(exc: Exception, *, status: int = 400, prefix: str | Non
     return _json_error(out, status, code=code, details=details, hint=hint)
 
 
+_SECURITY_HEADERS = (
+    ("X-Content-Type-Options", "nosniff"),
+    ("X-Frame-Options", "DENY"),
+    ("Referrer-Policy", "strict-origin-when-cross-origin"),
+    ("Permissions-Policy", "geolocation=(), microphone=(), camera=()"),
+    (
+        "Content-Security-Policy",
+        "default-src 'self'; img-src 'self' data: blob: https:; style-src 'self' 'unsafe-inline'; script-src 'self' 'unsafe-inline'; connect-src 'self' https:; frame-ancestors 'none'; base-uri 'self'; form-action 'self'",
+    ),
+)
+
+
 @app.before_request
 def attach_auth_session():
-    if request.path.startswith("/api/") and request.method in {"POST", "PUT", "PATCH", "DELETE"}:
+    if request.method == "OPTIONS" or not request.path.startswith("/api/"):
+        # Frontend files and CORS preflights (answered by Flask + flask-cors) need no session, CSRF or rate-limit work.
+        g.auth_session = None
+        g.auth_rank = _auth_role_rank(None)
+        return None
+    # One clock reading for the rate-limit and session checks; handlers read the wall clock for their own stamps.
+    now = _utc_now_ts()
+    if request.method in {"POST", "PUT", "PATCH", "DELETE"}:
         origin = request.headers.get("Origin") or ""
         if origin and not _is_trusted_origin(origin):
             return _json_error("Blocked by CSRF origin policy.", 403)
-        if not _rate_limit_allow(f"api-write:{_client_ip()}", limit=180, window_seconds=60):
+        if not _rate_limit_allow(f"api-write:{_client_ip()}", limit=180, window_seconds=60, now=now):
             return _json_error("Too many requests. Please try again shortly.", 429)
-    g.auth_session = _get_auth_session_from_request()
+    g.auth_session = _get_auth_session_from_request(now)
+    # Resolved once per request; route guards compare against _AUTH_RANK_MEMBER/_AUTH_RANK_ADMIN.
+    g.auth_rank = _auth_role_rank((g.auth_session or {}).get("role"))
 
 
 @app.after_request
 def apply_security_headers(response):
-    response.headers.setdefault("X-Content-Type-Options", "nosniff")
-    response.headers.setdefault("X-Frame-Options", "DENY")
-    response.headers.setdefault("Referrer-Policy", "strict-origin-when-cross-origin")
-    response.headers.setdefault("Permissions-Policy", "geolocation=(), microphone=(), camera=()")
-    response.headers.setdefault(
-        "Content-Security-Policy",
-        "default-src 'self'; img-src 'self' data: blob: https:; style-src 'self' 'unsafe-inline'; script-src 'self' 'unsafe-inline'; connect-src 'self' https:; frame-ancestors 'none'; base-uri 'self'; form-action 'self'",
-    )
+    headers = response.headers
+    for name, value in _SECURITY_HEADERS:
+        headers.setdefault(name, value)
     if request.is_secure:
-        response.headers.setdefault("Strict-Transport-Security", "max-age=31536000; includeSubDomains")
+        headers.setdefault("Strict-Transport-Security", "max-age=31536000; includeSubDomains")
     return response
 
 
+# Precompressed variants (e.g. css/base.css.br) are served when present and accepted by the client.
+_PRECOMPRESSED_ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+# Frontend assets are not content-hashed, so they get a short shared cache rather than "immutable".
+_STATIC_ASSET_SUFFIXES = frozenset({".js", ".css", ".png", ".jpg", ".jpeg", ".svg", ".webp", ".ico", ".woff2"})
+_STATIC_ASSET_MAX_AGE_SECONDS = int(str(os.environ.get("STATIC_ASSET_MAX_AGE_SECONDS") or "600").strip() or "600")
+
+
+@lru_cache(maxsize=1024)
+def _precompressed_variants(path: str) -> tuple[tuple[str, str], ...]:
+    # Cached per process: frontend files only change on deploy, which restarts the server.
+    # Variants older than their source (scripts/precompress_frontend.py not re-run) are ignored.
+    source = safe_join(app.static_folder, path)
+    if not source or not os.path.isfile(source):
+        return ()
+    source_mtime = os.path.getmtime(source)
+    variants = []
+    for encoding, suffix in _PRECOMPRESSED_ENCODINGS:
+        candidate = source + suffix
+        if os.path.isfile(candidate) and os.path.getmtime(candidate) >= source_mtime:
+            variants.append((encoding, path + suffix))
+    return tuple(variants)
+
+
+def _send_frontend_file(path: str):
+    # HTML keeps Flask's default (no-cache + conditional revalidation) so deploys show up immediately.
+    max_age = _STATIC_ASSET_MAX_AGE_SECONDS if Path(path).suffix.lower() in _STATIC_ASSET_SUFFIXES else None
+    for encoding, variant in _precompressed_variants(path):
+        if request.accept_encodings[encoding]:
+            response = send_from_directory(
+                app.static_folder, variant, mimetype=mimetypes.guess_type(path)[0], max_age=max_age
+            )
+            response.headers["Content-Encoding"] = encoding
+            response.vary.add("Accept-Encoding")
+            return response
+    return send_from_directory(app.static_folder, path, max_age=max_age)
+
+
 @app.route("/")
 def serve_landing():
-    return send_from_directory(app.static_folder, "landing.html")
+    return _send_frontend_file("landing.html")
 
 
 @app.route("/<path:path>")
 def serve_static(path: str):
-    return send_from_directory(app.static_folder, path)
+    return _send_frontend_file(path)
 
 
 # ---------------------------------------------------------------------------
@@ -700,8 +1207,13 @@ def auth_login():
         return _json_error("No account found for that email.", 404)
     if str(account.get("status") or "active").lower() != "active":
         return _json_error("This account is not active.", 403)
-    if not check_password_hash(str(account.get("password_hash") or ""), password):
+    if not _verify_password(account.get("password_hash"), password):
         return _json_error("Incorrect password.", 401)
+    if _password_needs_rehash(account.get("password_hash")):
+        try:
+            _upsert_auth_account({"email": email, "password_hash": _hash_password(password)})
+        except Exception:
+            pass
     session = _issue_auth_session(account)
     resp, status = _json_ok({"session": _auth_public_session_payload(session), "token": session["token"]})
     out = make_response(resp, status)
@@ -711,7 +1223,7 @@ def auth_login():
         max_age=_AUTH_SESSION_TTL_SECONDS,
         httponly=True,
         samesite="Lax",
-        secure=str(os.environ.get("AUTH_COOKIE_SECURE", "false")).lower() in {"1", "true", "yes"},
+        secure=_AUTH_COOKIE_SECURE,
         path="/",
     )
     return out
@@ -753,7 +1265,8 @@ def auth_bootstrap_admin():
 
     payload = request.get_json(silent=True) or {}
     provided_token = str(payload.get("bootstrap_token") or "").strip()
-    if not provided_token or provided_token != _AUTH_BOOTSTRAP_TOKEN:
+    # Constant-time comparison so response timing does not leak how much of the token matched.
+    if not provided_token or not secrets.compare_digest(provided_token.encode("utf-8"), _AUTH_BOOTSTRAP_TOKEN.encode("utf-8")):
         return _json_error("Invalid bootstrap token.", 403)
 
     email = str(payload.get("email") or "").strip().lower()
@@ -761,7 +1274,7 @@ def auth_bootstrap_admin():
     password = str(payload.get("password") or "")
     if not email:
         return _json_error("Email is required.", 400)
-    if "@" not in email or "." not in email.split("@")[-1]:
+    if not _looks_like_email(email):
         return _json_error("A valid email address is required.", 400)
     ok, message = _validate_password_strength(password)
     if not ok:
@@ -790,7 +1303,7 @@ def auth_bootstrap_admin():
         max_age=_AUTH_SESSION_TTL_SECONDS,
         httponly=True,
         samesite="Lax",
-        secure=str(os.environ.get("AUTH_COOKIE_SECURE", "false")).lower() in {"1", "true", "yes"},
+        secure=_AUTH_COOKIE_SECURE,
         path="/",
     )
     return out
@@ -800,20 +1313,22 @@ def auth_bootstrap_admin():
 @_require_auth("member")
 def auth_change_password():
     payload = request.get_json(silent=True) or {}
-    session = g.auth_session or {}
-    target_email = str(payload.get("email") or session.get("email") or "").strip().lower()
+    # Session emails are lowercased when the session is issued.
+    session_email = (g.auth_session or {}).get("email") or ""
+    target_email = str(payload.get("email") or "").strip().lower() or session_email
     current_password = str(payload.get("current_password") or "")
     new_password = str(payload.get("new_password") or "")
-    is_admin = _auth_role_rank(session.get("role")) >= _auth_role_rank("administrator")
+    is_admin = g.auth_rank >= _AUTH_RANK_ADMIN
+    is_self = target_email == session_email
     if not target_email:
         return _json_error("Target email is required", 400)
-    if not is_admin and target_email != str(session.get("email") or "").lower():
+    if not is_admin and not is_self:
         return _json_error("You can only change your own password", 403)
     ok, message = _change_auth_password(
         target_email,
         current_password=current_password,
         new_password=new_password,
-        admin_override=(is_admin and target_email != str(session.get("email") or "").lower()),
+        admin_override=(is_admin and not is_self),
     )
     if not ok:
         return _json_error(message, 400)
@@ -835,7 +1350,7 @@ def avatar_generate():
     seed = str(payload.get("seed") or "").strip()
     if not seed:
         seed = _avatar_seed(email=email, name=name, role=role, record_id=str(payload.get("record_id") or ""))
-    generated = generate_avatar_data_url(seed=seed, role=role)
+    generated = _generate_avatar(seed, role)
     return _json_ok({
         "avatar_url": generated.get("avatar_url"),
         "provider": generated.get("provider"),
@@ -852,6 +1367,7 @@ def avatar_regenerate_existing():
 
 
 @app.route("/api/fundraising/trends")
+@_conditional_get(public=True)
 def fundraising_trends():
     range_raw = str(request.args.get("range", "")).strip()
     range_days = int(range_raw) if range_raw.isdigit() else None
@@ -861,13 +1377,15 @@ def fundraising_trends():
 
 
 @app.route("/api/fundraising/total")
+@_conditional_get(public=True)
 def fundraising_total():
     return _json_ok(crm.get_fundraising_total())
 
 
 @app.route("/api/donations/recent")
+@_conditional_get(public=True)
 def recent_donations():
-    limit = int(request.args.get("limit", 10))
+    limit = _query_int("limit", 10)
     return _json_ok(crm.get_recent_donations(limit=limit))
 
 
@@ -883,21 +1401,25 @@ def create_donation():
 
 
 @app.route("/api/campaigns/active")
+@_conditional_get(public=True)
 def active_campaigns():
     return _json_ok(crm.get_active_campaigns())
 
 
 @app.route("/api/impact/monthly")
+@_conditional_get(public=True)
 def monthly_impact():
     return _json_ok(crm.get_monthly_impact())
 
 
 @app.route("/api/stats/overview")
+@_conditional_get(public=True)
 def stats_overview():
     return _json_ok(crm.get_stats_overview())
 
 
 @app.route("/api/updates/recent")
+@_conditional_get(public=True)
 def recent_updates():
     return _json_ok(crm.get_recent_updates())
 
@@ -907,26 +1429,36 @@ def recent_updates():
 # ---------------------------------------------------------------------------
 
 
+def _with_donor_avatar(payload: dict) -> dict:
+    if not str(payload.get("avatar_url") or "").strip():
+        donor_name = str(payload.get("full_name") or payload.get("name") or "").strip()
+        donor_email = str(payload.get("email") or "").strip().lower()
+        seed = _avatar_seed(donor_email, donor_name, "donor")
+        payload["avatar_url"] = _generate_avatar(seed, "donor").get("avatar_url")
+    return payload
+
+
 @app.route("/api/donors", methods=["GET", "POST"])
+@_conditional_get
 @_require_auth("member")
 def get_donors():
     if request.method == "POST":
-        payload = request.get_json(silent=True) or {}
-        if not str(payload.get("avatar_url") or "").strip():
-            donor_name = str(payload.get("full_name") or payload.get("name") or "").strip()
-            donor_email = str(payload.get("email") or "").strip().lower()
-            seed = _avatar_seed(donor_email, donor_name, "donor")
-            payload["avatar_url"] = generate_avatar_data_url(seed=seed, role="donor").get("avatar_url")
+        payload = _with_donor_avatar(request.get_json(silent=True) or {})
         try:
             created = crm.create_donor(payload)
         except Exception as exc:
             return _json_from_exception(exc, status=400, prefix="Unable to create donor")
         return _json_ok({"donor": created}, status=201)
-    limit = int(request.args.get("limit", 100))
+    ids = _query_ids()
+    if ids is not None:
+        rows = crm.get_donors(limit=len(ids) or 1, donor_ids=ids).get("donors") or []
+        return _json_ok({"donors": _rows_by_id(rows, ids)})
+    limit = _query_int("limit", 100)
     return _json_ok(crm.get_donors(limit=limit))
 
 
 @app.route("/api/donors/stats", methods=["GET"])
+@_conditional_get
 @_require_auth("member")
 def donor_stats():
     return _json_ok(crm.get_donor_stats())
@@ -960,7 +1492,7 @@ def donor_notes(donor_id: str):
     if request.method == "GET":
         return _json_ok(crm.get_donor_notes(donor_id))
     payload = request.get_json(silent=True) or {}
-    author = (getattr(g, "auth_session", {}) or {}).get("full_name") or "Team Member"
+    author = g.auth_session.get("full_name") or "Team Member"
     created = crm.create_donor_note(donor_id, {**payload, "author": author})
     if not created:
         return _json_error("Note content is required", 400)
@@ -968,21 +1500,23 @@ def donor_notes(donor_id: str):
 
 
 @app.route("/api/contacts", methods=["GET"])
+@_conditional_get
 @_require_auth("member")
 def contacts():
-    limit = int(request.args.get("limit", 500))
+    limit = _query_int("limit", 500)
     return _json_ok(crm.get_contacts(limit=limit))
 
 
 @app.route("/api/campaigns", methods=["GET", "POST"])
+@_conditional_get(public=True)
 def campaigns():
     if request.method == "GET":
-        limit = int(request.args.get("limit", 100))
+        limit = _query_int("limit", 100)
         return _json_ok(crm.get_campaigns(limit=limit))
 
-    if _auth_role_rank((getattr(g, "auth_session", {}) or {}).get("role")) < _auth_role_rank("member"):
-        return _json_error("Authentication required", 401)
-    payload = request.get_json(silent=True) or {}
+    payload, error = _member_payload()
+    if error:
+        return error
     try:
         created = crm.create_campaign(payload)
     except Exception as exc:
@@ -999,7 +1533,7 @@ def campaign_detail(campaign_id: str):
         return _json_ok({"campaign": campaign})
 
     if request.method == "DELETE":
-        if _auth_role_rank((getattr(g, "auth_session", {}) or {}).get("role")) < _auth_role_rank("member"):
+        if g.auth_rank < _AUTH_RANK_MEMBER:
             return _json_error("Authentication required", 401)
         try:
             deleted = crm.delete_campaign(campaign_id)
@@ -1009,9 +1543,9 @@ def campaign_detail(campaign_id: str):
             return _json_error("Campaign could not be deleted", 400)
         return _json_ok({"deleted": True, "campaign_id": campaign_id})
 
-    if _auth_role_rank((getattr(g, "auth_session", {}) or {}).get("role")) < _auth_role_rank("member"):
-        return _json_error("Authentication required", 401)
-    payload = request.get_json(silent=True) or {}
+    payload, error = _member_payload()
+    if error:
+        return error
     try:
         updated = crm.update_campaign(campaign_id, payload)
     except Exception as exc:
@@ -1022,13 +1556,18 @@ def campaign_detail(campaign_id: str):
 
 
 @app.route("/api/animals", methods=["GET", "POST"])
+@_conditional_get(public=True)
 def animals():
     if request.method == "GET":
-        limit = int(request.args.get("limit", 100))
+        ids = _query_ids()
+        if ids is not None:
+            rows = crm.get_animals(limit=len(ids) or 1, animal_ids=ids).get("animals") or []
+            return _json_ok({"animals": _rows_by_id(rows, ids)})
+        limit = _query_int("limit", 100)
         return _json_ok(crm.get_animals(limit=limit))
-    if _auth_role_rank((getattr(g, "auth_session", {}) or {}).get("role")) < _auth_role_rank("member"):
-        return _json_error("Authentication required", 401)
-    payload = request.get_json(silent=True) or {}
+    payload, error = _member_payload()
+    if error:
+        return error
     try:
         created = crm.create_animal(payload)
     except Exception as exc:
@@ -1043,7 +1582,7 @@ def animal_detail(animal_id: str):
         if not animal:
             return _json_error("Animal not found", 404)
         return _json_ok({"animal": animal})
-    if _auth_role_rank((getattr(g, "auth_session", {}) or {}).get("role")) < _auth_role_rank("member"):
+    if g.auth_rank < _AUTH_RANK_MEMBER:
         return _json_error("Authentication required", 401)
     if request.method == "DELETE":
         deleted = crm.delete_animal(animal_id)
@@ -1064,10 +1603,10 @@ def animal_detail(animal_id: str):
 def animal_notes(animal_id: str):
     if request.method == "GET":
         return _json_ok(crm.get_animal_notes(animal_id))
-    if _auth_role_rank((getattr(g, "auth_session", {}) or {}).get("role")) < _auth_role_rank("member"):
-        return _json_error("Authentication required", 401)
-    payload = request.get_json(silent=True) or {}
-    author = (getattr(g, "auth_session", {}) or {}).get("full_name") or "Team Member"
+    payload, error = _member_payload()
+    if error:
+        return error
+    author = g.auth_session.get("full_name") or "Team Member"
     created = crm.create_animal_note(animal_id, {**payload, "author": author})
     if not created:
         return _json_error("Note content is required", 400)
@@ -1075,13 +1614,14 @@ def animal_notes(animal_id: str):
 
 
 @app.route("/api/events", methods=["GET", "POST"])
+@_conditional_get(public=True)
 def events():
     if request.method == "GET":
-        limit = int(request.args.get("limit", 100))
+        limit = _query_int("limit", 100)
         return _json_ok(crm.get_events(limit=limit))
-    if _auth_role_rank((getattr(g, "auth_session", {}) or {}).get("role")) < _auth_role_rank("member"):
-        return _json_error("Authentication required", 401)
-    payload = request.get_json(silent=True) or {}
+    payload, error = _member_payload()
+    if error:
+        return error
     try:
         created = crm.create_event(payload)
     except Exception as exc:
@@ -1090,13 +1630,14 @@ def events():
 
 
 @app.route("/api/stories", methods=["GET", "POST"])
+@_conditional_get(public=True)
 def stories():
     if request.method == "GET":
-        limit = int(request.args.get("limit", 100))
+        limit = _query_int("limit", 100)
         return _json_ok(crm.get_stories(limit=limit))
-    if _auth_role_rank((getattr(g, "auth_session", {}) or {}).get("role")) < _auth_role_rank("member"):
-        return _json_error("Authentication required", 401)
-    payload = request.get_json(silent=True) or {}
+    payload, error = _member_payload()
+    if error:
+        return error
     try:
         created = crm.create_story(payload)
     except Exception as exc:
@@ -1104,6 +1645,33 @@ def stories():
     return _json_ok({"story": created}, status=201)
 
 
+_BULK_CREATE_MAX_RECORDS = 500
+_BULK_CREATORS = {
+    "donors": lambda records: crm.create_donors_bulk([_with_donor_avatar(r) for r in records]),
+    "campaigns": crm.create_campaigns_bulk,
+    "animals": crm.create_animals_bulk,
+    "events": crm.create_events_bulk,
+    "stories": crm.create_stories_bulk,
+}
+
+
+@app.route("/api/<any(donors, campaigns, animals, events, stories):entity>/bulk", methods=["POST"])
+@_require_auth("member")
+def bulk_create(entity: str):
+    """Create many records of one type with a single CRM insert (all-or-nothing)."""
+    payload = request.get_json(silent=True) or {}
+    records = payload.get("records")
+    if not isinstance(records, list) or not records or not all(isinstance(r, dict) for r in records):
+        return _json_error("records must be a non-empty list of objects.", 400)
+    if len(records) > _BULK_CREATE_MAX_RECORDS:
+        return _json_error(f"At most {_BULK_CREATE_MAX_RECORDS} records can be created per request.", 400)
+    try:
+        created = _BULK_CREATORS[entity](records)
+    except Exception as exc:
+        return _json_from_exception(exc, status=400, prefix=f"Unable to create {entity}")
+    return _json_ok({entity: created, "created_count": len(created)}, status=201)
+
+
 @app.route("/api/stories/<story_id>", methods=["GET", "PUT"])
 def story_detail(story_id: str):
     if request.method == "GET":
@@ -1111,9 +1679,9 @@ def story_detail(story_id: str):
         if not story:
             return _json_error("Story not found", 404)
         return _json_ok({"story": story})
-    if _auth_role_rank((getattr(g, "auth_session", {}) or {}).get("role")) < _auth_role_rank("member"):
-        return _json_error("Authentication required", 401)
-    payload = request.get_json(silent=True) or {}
+    payload, error = _member_payload()
+    if error:
+        return error
     try:
         updated = crm.update_story(story_id, payload)
     except Exception as exc:
@@ -1123,21 +1691,28 @@ def story_detail(story_id: str):
     return _json_ok({"story": updated})
 
 
+def _public_requester(payload: dict) -> tuple[dict | None, str | None]:
+    """Normalize the contact fields shared by the public request forms; returns (fields, error)."""
+    name = str(payload.get("requester_name") or payload.get("name") or "").strip()
+    phone = str(payload.get("requester_phone") or payload.get("phone") or "").strip()
+    email = str(payload.get("requester_email") or payload.get("email") or "").strip().lower()
+    if not name or not phone or not email:
+        return None, "Name, phone number, and email are required."
+    if not _looks_like_email(email):
+        return None, "A valid email address is required."
+    return {"requester_name": name, "requester_phone": phone, "requester_email": email}, None
+
+
 @app.route("/api/public/adoption-requests", methods=["POST"])
 def public_adoption_requests():
     payload = request.get_json(silent=True) or {}
-    requester_name = str(payload.get("requester_name") or payload.get("name") or "").strip()
-    requester_phone = str(payload.get("requester_phone") or payload.get("phone") or "").strip()
-    requester_email = str(payload.get("requester_email") or payload.get("email") or "").strip().lower()
+    requester, error = _public_requester(payload)
+    if error:
+        return _json_error(error, 400)
     notes = str(payload.get("notes") or "").strip()
     animal_id = str(payload.get("animal_id") or "").strip()
     animal_name = str(payload.get("animal_name") or "").strip()
 
-    if not requester_name or not requester_phone or not requester_email:
-        return _json_error("Name, phone number, and email are required.", 400)
-    if "@" not in requester_email or "." not in requester_email.split("@")[-1]:
-        return _json_error("A valid email address is required.", 400)
-
     if animal_id and not animal_name:
         try:
             found = crm.get_animal(animal_id)
@@ -1147,28 +1722,31 @@ def public_adoption_requests():
             pass
 
     record = {
-        "id": f"adopt-{uuid.uuid4().hex[:10]}",
+        "id": f"adopt-{secrets.token_hex(5)}",
         "submitted_at": _utc_now_iso(),
         "animal_id": animal_id or None,
         "animal_name": animal_name or "Unknown Animal",
-        "requester_name": requester_name,
-        "requester_phone": requester_phone,
-        "requester_email": requester_email,
+        **requester,
         "notes": notes,
         "source": "public-site",
     }
     _append_adoption_request(record)
-    sent, message = _send_adoption_request_email(record)
-    return _json_ok({"submitted": True, "email_sent": bool(sent), "message": message, "request_id": record["id"]}, status=201)
+    _queue_notification_email(_send_adoption_request_email, record)
+    return _json_ok(
+        {
+            "submitted": True,
+            "email_queued": True,
+            "message": "Request received; notification email queued.",
+            "request_id": record["id"],
+        },
+        status=201,
+    )
 
 
 @app.route("/api/public/help-requests", methods=["POST"])
 def public_help_requests():
     payload = request.get_json(silent=True) or {}
     request_type = str(payload.get("request_type") or "volunteer").strip().lower()
-    requester_name = str(payload.get("requester_name") or payload.get("name") or "").strip()
-    requester_phone = str(payload.get("requester_phone") or payload.get("phone") or "").strip()
-    requester_email = str(payload.get("requester_email") or payload.get("email") or "").strip().lower()
     company_name = str(payload.get("company_name") or "").strip()
     company_size = str(payload.get("company_size") or "").strip()
     giving_interest = str(payload.get("giving_interest") or "").strip()
@@ -1176,21 +1754,18 @@ def public_help_requests():
 
     if request_type not in {"volunteer", "business"}:
         return _json_error("request_type must be 'volunteer' or 'business'.", 400)
-    if not requester_name or not requester_phone or not requester_email:
-        return _json_error("Name, phone number, and email are required.", 400)
-    if "@" not in requester_email or "." not in requester_email.split("@")[-1]:
-        return _json_error("A valid email address is required.", 400)
+    requester, error = _public_requester(payload)
+    if error:
+        return _json_error(error, 400)
     if request_type == "business":
         if not company_name or not company_size:
             return _json_error("Company name and company size are required for business requests.", 400)
 
     record = {
-        "id": f"help-{uuid.uuid4().hex[:10]}",
+        "id": f"help-{secrets.token_hex(5)}",
         "submitted_at": _utc_now_iso(),
         "request_type": request_type,
-        "requester_name": requester_name,
-        "requester_phone": requester_phone,
-        "requester_email": requester_email,
+        **requester,
         "company_name": company_name or None,
         "company_size": company_size or None,
         "giving_interest": giving_interest or None,
@@ -1198,12 +1773,12 @@ def public_help_requests():
         "source": "public-site",
     }
     _append_help_request(record)
-    sent, message = _send_help_request_email(record)
+    _queue_notification_email(_send_help_request_email, record)
     return _json_ok(
         {
             "submitted": True,
-            "email_sent": bool(sent),
-            "message": message,
+            "email_queued": True,
+            "message": "Request received; notification email queued.",
             "request_id": record["id"],
             "request_type": request_type,
         },
@@ -1214,11 +1789,11 @@ def public_help_requests():
 @app.route("/api/communications/campaigns", methods=["GET", "POST"])
 def communications_campaigns():
     if request.method == "GET":
-        limit = int(request.args.get("limit", 100))
+        limit = _query_int("limit", 100)
         return _json_ok(crm.get_communications(limit=limit))
-    if _auth_role_rank((getattr(g, "auth_session", {}) or {}).get("role")) < _auth_role_rank("member"):
-        return _json_error("Authentication required", 401)
-    payload = request.get_json(silent=True) or {}
+    payload, error = _member_payload()
+    if error:
+        return error
     try:
         created = crm.create_communication_campaign(payload)
     except Exception as exc:
@@ -1233,9 +1808,9 @@ def communications_campaign_detail(campaign_id: str):
         if not campaign:
             return _json_error("Campaign not found", 404)
         return _json_ok({"campaign": campaign})
-    if _auth_role_rank((getattr(g, "auth_session", {}) or {}).get("role")) < _auth_role_rank("member"):
-        return _json_error("Authentication required", 401)
-    payload = request.get_json(silent=True) or {}
+    payload, error = _member_payload()
+    if error:
+        return error
     try:
         updated = crm.update_communication_campaign(campaign_id, payload)
     except Exception as exc:
@@ -1246,8 +1821,9 @@ def communications_campaign_detail(campaign_id: str):
 
 
 @app.route("/api/reports", methods=["GET"])
+@_conditional_get(public=True)
 def reports():
-    limit = int(request.args.get("limit", 100))
+    limit = _query_int("limit", 100)
     return _json_ok(crm.get_reports(limit=limit))
 
 
@@ -1258,9 +1834,9 @@ def report_detail(report_id: str):
         if not report:
             return _json_error("Report not found", 404)
         return _json_ok({"report": report})
-    if _auth_role_rank((getattr(g, "auth_session", {}) or {}).get("role")) < _auth_role_rank("member"):
-        return _json_error("Authentication required", 401)
-    payload = request.get_json(silent=True) or {}
+    payload, error = _member_payload()
+    if error:
+        return error
     try:
         updated = crm.update_report(report_id, payload)
     except Exception as exc:
@@ -1271,12 +1847,13 @@ def report_detail(report_id: str):
 
 
 @app.route("/api/explorer/organizations", methods=["GET"])
+@_conditional_get
 @_require_auth("member")
 def explorer_organizations():
     location = request.args.get("location", "").strip()
     radius_miles = request.args.get("radius_miles")
-    limit = int(request.args.get("limit", 100))
-    min_score = int(request.args.get("min_score", 0))
+    limit = _query_int("limit", 100)
+    min_score = _query_int("min_score", 0, minimum=0, maximum=100)
     return _json_ok(crm.get_explorer_organizations(
         location=location,
         radius_miles=radius_miles,
@@ -1301,10 +1878,21 @@ def explorer_schema_status():
     return _json_ok({"schema": crm.get_explorer_schema_status()})
 
 
+def _explorer_job_accepted(job: dict):
+    return _json_ok(
+        {"job": job, "poll_url": url_for("explorer_discover_job_status", job_id=job["job_id"])},
+        status=202,
+    )
+
+
 @app.route("/api/explorer/discover", methods=["POST"])
 @_require_auth("member")
 def explorer_discover():
     payload = request.get_json(silent=True) or {}
+    if str(request.args.get("sync") or "").strip().lower() not in {"1", "true", "yes"}:
+        return _explorer_job_accepted(_start_explorer_discovery_job(payload))
+
+    app.logger.warning("POST /api/explorer/discover?sync=true is deprecated; use /api/explorer/discover/jobs.")
     location = str(payload.get("location") or "").strip() or None
     radius_miles = payload.get("radius_miles")
     limit = payload.get("limit", 50)
@@ -1315,7 +1903,7 @@ def explorer_discover():
     extract_contacts = bool(payload.get("extract_contacts", True))
     dry_run = bool(payload.get("dry_run", False))
 
-    result = run_scraper_discovery(
+    result = _scraper_discover().run_discovery(
         location=location,
         radius_miles=radius_miles,
         limit=limit,
@@ -1342,7 +1930,9 @@ def explorer_import():
         records = payload.get("organizations") or []
     extract_contacts = bool(payload.get("extract_contacts", False))
     min_score = payload.get("min_score", 0)
-    result = import_discovery_results(
+    if isinstance(records, list) and len(records) > _EXPLORER_IMPORT_ASYNC_THRESHOLD:
+        return _explorer_job_accepted(_start_explorer_import_job(records, extract_contacts=extract_contacts, min_score=min_score))
+    result = _scraper_discover().import_discovery_results(
         records,
         extract_contacts=extract_contacts,
         min_score=min_score,
@@ -1354,16 +1944,22 @@ def explorer_import():
 @_require_auth("member")
 def explorer_discover_start_job():
     payload = request.get_json(silent=True) or {}
-    job = _start_explorer_discovery_job(payload)
-    return _json_ok({"job": job}, status=202)
+    return _explorer_job_accepted(_start_explorer_discovery_job(payload))
 
 
 @app.route("/api/explorer/discover/jobs/<job_id>", methods=["GET"])
+@_conditional_get
 @_require_auth("member")
 def explorer_discover_job_status(job_id: str):
-    job = _explorer_job_snapshot(job_id)
+    job = _explorer_job_snapshot(job_id, summary=True)
     if not job:
         return _json_error("Explorer discovery job not found", 404)
+    result = job.get("result")
+    if isinstance(result, dict) and len(result.get("organizations") or []) > _EXPLORER_STREAM_MIN_ORGANIZATIONS:
+        # Completed discovery runs can carry thousands of organizations with nested contacts.
+        # Streaming swaps the list for a placeholder, so it works on copies of the stored job.
+        job = {**job, "result": dict(result)}
+        return _json_ok_streamed({"job": job}, job["result"], "organizations")
     return _json_ok({"job": job})
 
 
@@ -1379,13 +1975,14 @@ def generate_report():
 
 
 @app.route("/api/team", methods=["GET", "POST"])
+@_conditional_get
 def team():
     if request.method == "GET":
-        if _auth_role_rank((getattr(g, "auth_session", {}) or {}).get("role")) < _auth_role_rank("member"):
+        if g.auth_rank < _AUTH_RANK_MEMBER:
             return _json_error("Authentication required", 401)
-        limit = int(request.args.get("limit", 100))
+        limit = _query_int("limit", 100)
         return _json_ok(crm.get_team(limit=limit))
-    if _auth_role_rank((getattr(g, "auth_session", {}) or {}).get("role")) < _auth_role_rank("administrator"):
+    if g.auth_rank < _AUTH_RANK_ADMIN:
         return _json_error("Administrator access required", 403)
     payload = request.get_json(silent=True) or {}
     if not str(payload.get("avatar_url") or "").strip():
@@ -1393,7 +1990,7 @@ def team():
         email = str(payload.get("email") or "").strip().lower()
         role = str(payload.get("role") or "member").strip().lower()
         seed = _avatar_seed(email, full_name, role)
-        payload["avatar_url"] = generate_avatar_data_url(seed=seed, role=role).get("avatar_url")
+        payload["avatar_url"] = _generate_avatar(seed, role).get("avatar_url")
     create_mode = str(payload.get("mode") or "").lower()
     target_status = str(payload.get("status") or "").lower()
     requires_password = create_mode == "member" or target_status == "active"
@@ -1419,14 +2016,14 @@ def team():
 @app.route("/api/team/<member_id>", methods=["GET", "PUT", "DELETE"])
 def team_member(member_id: str):
     if request.method == "GET":
-        if _auth_role_rank((getattr(g, "auth_session", {}) or {}).get("role")) < _auth_role_rank("member"):
+        if g.auth_rank < _AUTH_RANK_MEMBER:
             return _json_error("Authentication required", 401)
         member = crm.get_team_member(member_id)
         if not member:
             return _json_error("Team member not found", 404)
         return _json_ok({"member": member})
     if request.method == "PUT":
-        if _auth_role_rank((getattr(g, "auth_session", {}) or {}).get("role")) < _auth_role_rank("administrator"):
+        if g.auth_rank < _AUTH_RANK_ADMIN:
             return _json_error("Administrator access required", 403)
         payload = request.get_json(silent=True) or {}
         if "password" in payload and str(payload.get("password") or "").strip():
@@ -1444,28 +2041,24 @@ def team_member(member_id: str):
         except Exception as exc:
             return _json_from_exception(exc, status=400, prefix="Unable to configure auth account for team member")
         return _json_ok({"member": updated})
-    if _auth_role_rank((getattr(g, "auth_session", {}) or {}).get("role")) < _auth_role_rank("administrator"):
+    if g.auth_rank < _AUTH_RANK_ADMIN:
         return _json_error("Administrator access required", 403)
     target_member = crm.get_team_member(member_id)
     if target_member and str(target_member.get("role") or "").lower() == "administrator":
-        team_rows = (crm.get_team(limit=2000) or {}).get("team") or []
-        active_admins = [
-            row for row in team_rows
-            if str(row.get("role") or "").lower() == "administrator"
-            and str(row.get("status") or "").lower() == "active"
-        ]
-        if len(active_admins) <= 1:
+        try:
+            active_admins = crm.count_active_admins()
+        except Exception as exc:
+            return _json_from_exception(exc, status=400, prefix="Unable to disable team member")
+        if active_admins <= 1:
             return _json_error("Cannot disable the last active administrator account.", 409)
     try:
-        deleted = crm.delete_team_member(member_id)
+        member = crm.delete_team_member(member_id)
     except Exception as exc:
         return _json_from_exception(exc, status=400, prefix="Unable to disable team member")
-    if not deleted:
+    if not member:
         return _json_error("Team member not found", 404)
     try:
-        member = crm.get_team_member(member_id)
-        if member:
-            _sync_team_member_to_auth_store(member)
+        _sync_team_member_to_auth_store(member)
     except Exception:
         pass
     return _json_ok({"deleted": True, "id": member_id})
@@ -1477,15 +2070,16 @@ def team_member(member_id: str):
 
 
 @app.route("/api/progress/runs", methods=["GET", "POST"])
+@_conditional_get
 def automation_runs():
     if request.method == "GET":
-        if _auth_role_rank((getattr(g, "auth_session", {}) or {}).get("role")) < _auth_role_rank("member"):
+        if g.auth_rank < _AUTH_RANK_MEMBER:
             return _json_error("Authentication required", 401)
-        limit = int(request.args.get("limit", 50))
+        limit = _query_int("limit", 50)
         return _json_ok(crm.get_automation_runs(limit=limit))
-    if _auth_role_rank((getattr(g, "auth_session", {}) or {}).get("role")) < _auth_role_rank("member"):
-        return _json_error("Authentication required", 401)
-    payload = request.get_json(silent=True) or {}
+    payload, error = _member_payload()
+    if error:
+        return error
     try:
         created = crm.create_automation_run(payload)
     except Exception as exc:
@@ -6,6 +6,8 @@ Limited test run: Discover 10 organizations, extract contacts, and store in Supa
 import os
 import sys
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlparse
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -14,12 +16,37 @@ load_dotenv()
 sys.path.insert(0, os.path.dirname(__file__))
 
 from scraper.discover import SEED_ORGANIZATIONS
-from db.client import upsert_organization, get_organizations
-from scraper.extract_contacts import extract_contacts_static, upsert_contact
+from db.client import get_organizations, upsert_contacts_bulk, upsert_organizations_bulk
+from scraper.extract_contacts import extract_contacts_static
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
 logger = logging.getLogger(__name__)
 
+# Different sites are scraped concurrently; organizations sharing a site (and every page within one)
+# are scraped one after another, with fetch_page's polite delay between requests.
+EXTRACTION_WORKERS = int(os.environ.get("LIMITED_RUN_EXTRACTION_WORKERS", "8"))
+
+
+def _group_by_site(orgs: list[dict]) -> list[list[dict]]:
+    """Group organizations by website host so no two workers scrape the same server at once."""
+    groups = {}
+    for index, org in enumerate(orgs):
+        website = org.get('website') or ''
+        host = (urlparse(website if '://' in website else f"https://{website}").hostname or '').lower()
+        host = host[4:] if host.startswith('www.') else host
+        groups.setdefault(host or index, []).append(org)
+    return list(groups.values())
+
+
+def _extract_site(site_orgs: list[dict]) -> list[tuple[dict, list | None, Exception | None]]:
+    results = []
+    for org in site_orgs:
+        try:
+            results.append((org, extract_contacts_static(org.get('website', ''), org.get('id')), None))
+        except Exception as e:
+            results.append((org, None, e))
+    return results
+
 
 def run_limited_test(limit: int = 10):
     """
@@ -31,55 +58,81 @@ def run_limited_test(limit: int = 10):
     logger.info(f"\nStep 1: Upserting first {limit} seed organizations to database...")
     test_orgs = SEED_ORGANIZATIONS[:limit]
 
-    success_count = 0
-    for org in test_orgs:
-        try:
-            upsert_organization(org)
-            logger.info(f"  ✓ {org['name']}")
-            success_count += 1
-        except Exception as e:
-            logger.error(f"  ✗ Failed to upsert '{org['name']}': {e}")
-
-    logger.info(f"Successfully upserted {success_count}/{limit} organizations")
-
-    # Step 2: Fetch organizations from database
-    logger.info(f"\nStep 2: Fetching organizations from database...")
+    # One upsert request for the whole batch; rows that fail are retried and reported individually.
     try:
-        orgs = get_organizations(min_score=6)  # Get high-value orgs only
-        logger.info(f"Retrieved {len(orgs)} organizations with score >= 6")
+        saved_orgs, failed_orgs = upsert_organizations_bulk(test_orgs)
     except Exception as e:
-        logger.error(f"Failed to fetch organizations: {e}")
-        return
+        logger.error(f"  ✗ Failed to upsert organizations: {e}")
+        saved_orgs, failed_orgs = [], []
+    # Per-row log lines use lazy %-formatting so they cost nothing when INFO is filtered out.
+    for org in saved_orgs:
+        logger.info("  ✓ %s", org.get('name'))
+    for org, e in failed_orgs:
+        logger.error("  ✗ Failed to upsert '%s': %s", org['name'], e)
+    success_count = len(saved_orgs)
 
-    # Step 3: Extract contacts for each organization
-    logger.info(f"\nStep 3: Extracting contacts from {len(orgs)} organization websites...")
-    total_contacts = 0
-
-    for i, org in enumerate(orgs, 1):
-        org_name = org.get('name', 'Unknown')
-        org_id = org.get('id')
-        website = org.get('website', '')
-
-        logger.info(f"\n[{i}/{len(orgs)}] Processing: {org_name}")
-        logger.info(f"  Website: {website}")
+    logger.info(f"Successfully upserted {success_count}/{limit} organizations")
 
+    # Step 2: Select high-value organizations. The upsert returns the saved rows (with their ids),
+    # so only fall back to a database fetch when nothing came back from step 1.
+    logger.info(f"\nStep 2: Selecting organizations with score >= 6...")
+    orgs = [o for o in saved_orgs if (o.get('donation_potential_score') or 0) >= 6]
+    if orgs:
+        logger.info(f"Selected {len(orgs)} upserted organizations with score >= 6")
+    else:
         try:
-            contacts = extract_contacts_static(website, org_id)
-
-            if contacts:
-                logger.info(f"  Found {len(contacts)} contact(s)")
-                for contact in contacts:
-                    try:
-                        upsert_contact(contact)
-                        total_contacts += 1
-                        logger.info(f"    ✓ {contact.get('full_name', 'Unknown')} - {contact.get('email', 'No email')}")
-                    except Exception as e:
-                        logger.error(f"    ✗ Failed to save contact: {e}")
-            else:
-                logger.info(f"  No contacts found")
-
+            orgs = get_organizations(min_score=6)  # Get high-value orgs only
+            logger.info(f"Retrieved {len(orgs)} organizations with score >= 6")
         except Exception as e:
-            logger.error(f"  Error extracting contacts: {e}")
+            logger.error(f"Failed to fetch organizations: {e}")
+            return
+
+    # Step 3: Extract contacts for each organization
+    logger.info(f"\nStep 3: Extracting contacts from {len(orgs)} organization websites...")
+    extracted_contacts = []
+    # Staff without a personal address fall back to the site's generic email, so one address often comes
+    # back for several people; keep the first (highest-priority title) contact per (org, email).
+    seen_contact_keys = set()
+    duplicate_count = 0
+
+    sites = _group_by_site(orgs)
+    with ThreadPoolExecutor(max_workers=max(1, min(EXTRACTION_WORKERS, len(sites) or 1))) as executor:
+        futures = [executor.submit(_extract_site, site_orgs) for site_orgs in sites]
+        # Contacts are collected on the main thread and saved together once every site has finished.
+        i = 0
+        for future in as_completed(futures):
+            for org, contacts, error in future.result():
+                i += 1
+                logger.info("\n[%d/%d] Processed: %s", i, len(orgs), org.get('name', 'Unknown'))
+                logger.info("  Website: %s", org.get('website', ''))
+
+                if error is not None:
+                    logger.error("  Error extracting contacts: %s", error)
+                elif contacts:
+                    logger.info("  Found %d contact(s)", len(contacts))
+                    for contact in contacts:
+                        email = (contact.get('email') or '').strip().lower()
+                        if email:
+                            key = (contact.get('org_id'), email)
+                            if key in seen_contact_keys:
+                                duplicate_count += 1
+                                continue
+                            seen_contact_keys.add(key)
+                        extracted_contacts.append(contact)
+                else:
+                    logger.info("  No contacts found")
+
+    logger.info(f"\nSaving {len(extracted_contacts)} contact(s) ({duplicate_count} duplicate email(s) skipped)...")
+    try:
+        saved_contacts, failed_contacts = upsert_contacts_bulk(extracted_contacts) if extracted_contacts else ([], [])
+    except Exception as e:
+        logger.error(f"  ✗ Failed to save contacts: {e}")
+        saved_contacts, failed_contacts = [], []
+    for contact in saved_contacts:
+        logger.info("    ✓ %s - %s", contact.get('full_name', 'Unknown'), contact.get('email', 'No email'))
+    for contact, e in failed_contacts:
+        logger.error("    ✗ Failed to save contact %s: %s", contact.get('email', 'No email'), e)
+    total_contacts = len(saved_contacts)
 
     logger.info(f"\n{'='*60}")
     logger.info(f"TEST COMPLETE")
@@ -1,6 +1,8 @@
+import json
 import tempfile
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
 from fundraising_app import server
 
@@ -11,16 +13,20 @@ class AuthPermissionsTests(unittest.TestCase):
         cls._orig_auth_store_path = server._AUTH_STORE_PATH
         cls._orig_bootstrap_token = server._AUTH_BOOTSTRAP_TOKEN
         cls._orig_crm_client = server.crm._client
+        cls._orig_password_hash_method = server._PASSWORD_HASH_METHOD
         cls._temp_dir = tempfile.TemporaryDirectory()
         server._AUTH_STORE_PATH = Path(cls._temp_dir.name) / "auth_accounts.json"
         server._AUTH_BOOTSTRAP_TOKEN = "test-bootstrap-token"
         server.crm._client = lambda: None
+        # The default scrypt hash takes ~0.3 s by design; a cheap method keeps the same hash/verify path.
+        server._PASSWORD_HASH_METHOD = "pbkdf2:sha256:1000"
 
     @classmethod
     def tearDownClass(cls):
         server._AUTH_STORE_PATH = cls._orig_auth_store_path
         server._AUTH_BOOTSTRAP_TOKEN = cls._orig_bootstrap_token
         server.crm._client = cls._orig_crm_client
+        server._PASSWORD_HASH_METHOD = cls._orig_password_hash_method
         cls._temp_dir.cleanup()
 
     def setUp(self):
@@ -113,6 +119,73 @@ class AuthPermissionsTests(unittest.TestCase):
         member_team_resp = member_client.get("/api/team")
         self.assertEqual(member_team_resp.status_code, 200)
 
+    def _admin_client(self):
+        server._upsert_auth_account(
+            {
+                "email": "admin@example.org",
+                "full_name": "Admin User",
+                "role": "administrator",
+                "status": "active",
+                "password": "AdminPass123",
+            }
+        )
+        admin_client = server.app.test_client()
+        login_resp = admin_client.post(
+            "/api/auth/login",
+            json={"email": "admin@example.org", "password": "AdminPass123"},
+        )
+        self.assertEqual(login_resp.status_code, 200)
+        return admin_client
+
+    def test_last_active_admin_cannot_be_disabled(self):
+        admin_id = next(m["id"] for m in server.crm.MOCK["team"] if m.get("role") == "administrator")
+        self.assertEqual(server.crm.count_active_admins(), 1)
+        resp = self._admin_client().delete(f"/api/team/{admin_id}")
+        self.assertEqual(resp.status_code, 409)
+        self.assertEqual(server.crm.count_active_admins(), 1)
+
+    def test_last_admin_guard_reports_count_errors(self):
+        admin_id = next(m["id"] for m in server.crm.MOCK["team"] if m.get("role") == "administrator")
+        admin_client = self._admin_client()
+        with patch.object(server.crm, "count_active_admins", side_effect=RuntimeError("database unavailable")):
+            resp = admin_client.delete(f"/api/team/{admin_id}")
+        self.assertEqual(resp.status_code, 400)
+        self.assertIn("database unavailable", json.dumps(resp.get_json() or {}))
+
+    def test_list_limit_falls_back_on_malformed_input(self):
+        resp = self.client.get("/api/campaigns?limit=not-a-number")
+        self.assertEqual(resp.status_code, 200)
+        with server.app.test_request_context("/api/campaigns?limit=100000000"):
+            self.assertEqual(server._query_int("limit", 100), 1000)
+
+    def test_batched_animal_lookup_is_keyed_by_requested_id(self):
+        known_id = str(server.crm.MOCK["animals"][0]["id"])
+        resp = self.client.get(f"/api/animals?ids={known_id},missing-id")
+        self.assertEqual(resp.status_code, 200)
+        animals = (resp.get_json() or {}).get("animals") or {}
+        self.assertEqual(list(animals), [known_id, "missing-id"])
+        self.assertEqual(str(animals[known_id].get("id")), known_id)
+        self.assertIsNone(animals["missing-id"])
+
+    def test_auth_store_cache_tracks_file_changes(self):
+        server._upsert_auth_account(
+            {
+                "email": "cached@example.org",
+                "full_name": "Cached User",
+                "role": "member",
+                "status": "active",
+                "password": "CachedPass123",
+            }
+        )
+        account = server._find_auth_account("cached@example.org")
+        account["full_name"] = "Mutated Locally"
+        self.assertEqual(server._find_auth_account("cached@example.org").get("full_name"), "Cached User")
+
+        accounts = json.loads(server._AUTH_STORE_PATH.read_text(encoding="utf-8"))
+        accounts[0]["full_name"] = "Edited On Disk"
+        server._AUTH_STORE_PATH.write_text(json.dumps(accounts, indent=4), encoding="utf-8")
+        self.assertEqual(server._find_auth_account("cached@example.org").get("full_name"), "Edited On Disk")
+
     def test_fundraising_trends_range_and_custom_date_filters(self):
         range_resp = self.client.get("/api/fundraising/trends?range=30")
         self.assertEqual(range_resp.status_code, 200)
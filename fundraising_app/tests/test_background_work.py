@@ -0,0 +1,167 @@
+import io
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from fundraising_app import server
+
+
+def _clear_rate_limit_buckets():
+    # Logins and public submissions are rate limited per client, and every test client shares one address.
+    for _, buckets in server._RATE_LIMIT_STRIPES:
+        buckets.clear()
+
+
+def _wait_for(predicate, timeout: float = 5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        value = predicate()
+        if value:
+            return value
+        time.sleep(0.01)
+    raise AssertionError("timed out waiting for background work")
+
+
+class NotificationEmailQueueTests(unittest.TestCase):
+    def setUp(self):
+        self._temp_dir = tempfile.TemporaryDirectory()
+        temp_root = Path(self._temp_dir.name)
+        for name, path in (
+            ("_ADOPTION_REQUESTS_PATH", temp_root / ".runtime_adoption_requests.jsonl"),
+            ("_HELP_REQUESTS_PATH", temp_root / ".runtime_help_requests.jsonl"),
+        ):
+            path_patch = patch.object(server, name, path)
+            path_patch.start()
+            self.addCleanup(path_patch.stop)
+        _clear_rate_limit_buckets()
+        self.client = server.app.test_client()
+
+    def tearDown(self):
+        self._temp_dir.cleanup()
+
+    def test_submission_returns_before_the_email_is_sent(self):
+        release = threading.Event()
+        sent = []
+
+        def slow_send(record):
+            release.wait(5)
+            sent.append(record["id"])
+            return True, "Sent"
+
+        with patch.object(server, "_send_help_request_email", slow_send):
+            resp = self.client.post(
+                "/api/public/help-requests",
+                json={"request_type": "volunteer", "name": "Pat", "phone": "555-0100", "email": "pat@example.org"},
+            )
+            self.assertEqual(resp.status_code, 201)
+            payload = resp.get_json() or {}
+            self.assertTrue(payload.get("email_queued"))
+            self.assertEqual(sent, [])
+            release.set()
+            _wait_for(lambda: sent)
+        self.assertEqual(sent, [payload["request_id"]])
+
+    def test_worker_keeps_running_after_a_failed_send(self):
+        sent = []
+
+        def failing_send(record):
+            raise RuntimeError("smtp down")
+
+        def recording_send(record):
+            sent.append(record["id"])
+            return True, "Sent"
+
+        with patch("sys.stderr", new_callable=io.StringIO) as stderr:
+            server._queue_notification_email(failing_send, {"id": "first"})
+            server._queue_notification_email(recording_send, {"id": "second"})
+            _wait_for(lambda: sent)
+        self.assertEqual(sent, ["second"])
+        self.assertIn("first failed: smtp down", stderr.getvalue())
+
+
+class ExplorerJobFlowTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._orig_auth_store_path = server._AUTH_STORE_PATH
+        cls._orig_crm_client = server.crm._client
+        cls._orig_password_hash_method = server._PASSWORD_HASH_METHOD
+        cls._temp_dir = tempfile.TemporaryDirectory()
+        server._AUTH_STORE_PATH = Path(cls._temp_dir.name) / "auth_accounts.json"
+        server.crm._client = lambda: None
+        server._PASSWORD_HASH_METHOD = "pbkdf2:sha256:1000"
+
+    @classmethod
+    def tearDownClass(cls):
+        server._AUTH_STORE_PATH = cls._orig_auth_store_path
+        server.crm._client = cls._orig_crm_client
+        server._PASSWORD_HASH_METHOD = cls._orig_password_hash_method
+        cls._temp_dir.cleanup()
+
+    def setUp(self):
+        server._AUTH_SESSIONS.clear()
+        _clear_rate_limit_buckets()
+        server._upsert_auth_account(
+            {
+                "email": "member@example.org",
+                "full_name": "Member User",
+                "role": "member",
+                "status": "active",
+                "password": "MemberPass123",
+            }
+        )
+        self.client = server.app.test_client()
+        login_resp = self.client.post(
+            "/api/auth/login",
+            json={"email": "member@example.org", "password": "MemberPass123"},
+        )
+        self.assertEqual(login_resp.status_code, 200)
+
+    def _run_job(self, run_discovery):
+        with patch.object(server, "_scraper_discover", return_value=SimpleNamespace(run_discovery=run_discovery)):
+            resp = self.client.post("/api/explorer/discover/jobs", json={"location": "Denver, CO", "limit": 5})
+            self.assertEqual(resp.status_code, 202)
+            payload = resp.get_json() or {}
+            self.assertEqual(payload["job"]["status"], "queued")
+            poll_url = payload["poll_url"]
+            self.assertTrue(poll_url.endswith(payload["job"]["job_id"]))
+
+            def finished_job():
+                job = (self.client.get(poll_url).get_json() or {}).get("job") or {}
+                return job if job.get("status") in {"completed", "failed"} else None
+
+            return _wait_for(finished_job)
+
+    def test_discovery_job_reports_progress_and_result(self):
+        calls = []
+
+        def run_discovery(**kwargs):
+            calls.append(kwargs)
+            kwargs["progress_cb"]({"status": "running", "step": "search", "message": "Searching", "progress": 40})
+            return {"saved_count": 1, "matched_count": 1, "organizations": [{"name": "Shelter Friends"}]}
+
+        job = self._run_job(run_discovery)
+        self.assertEqual(job["status"], "completed")
+        self.assertEqual(job["progress"], 100)
+        self.assertEqual(job["result"]["organizations"], [{"name": "Shelter Friends"}])
+        self.assertEqual(calls[0]["location"], "Denver, CO")
+        self.assertEqual(calls[0]["limit"], 5)
+
+    def test_failed_discovery_job_reports_the_error(self):
+        def run_discovery(**kwargs):
+            raise RuntimeError("search backend unavailable")
+
+        job = self._run_job(run_discovery)
+        self.assertEqual(job["status"], "failed")
+        self.assertIn("search backend unavailable", job["error"]["message"])
+
+    def test_unknown_job_is_404(self):
+        resp = self.client.get("/api/explorer/discover/jobs/explr-missing")
+        self.assertEqual(resp.status_code, 404)
+
+
+if __name__ == "__main__":
+    unittest.main()
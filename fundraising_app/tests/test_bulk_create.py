@@ -0,0 +1,108 @@
+import tempfile
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+
+from fundraising_app import server
+
+
+class _FakeTable:
+    def __init__(self, client, name):
+        self.client = client
+        self.name = name
+
+    def insert(self, rows):
+        self.client.inserts.append((self.name, rows))
+        self.rows = rows
+        return self
+
+    def execute(self):
+        if self.client.error:
+            raise self.client.error
+        rows = [{"id": f"{self.name}-{i}", **row} for i, row in enumerate(self.rows)]
+        return SimpleNamespace(data=rows[: self.client.return_limit])
+
+
+class _FakeClient:
+    def __init__(self, *, error=None, return_limit=None):
+        self.error = error
+        self.return_limit = return_limit
+        self.inserts = []
+
+    def table(self, name):
+        return _FakeTable(self, name)
+
+
+class BulkCreateTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._orig_auth_store_path = server._AUTH_STORE_PATH
+        cls._orig_crm_client = server.crm._client
+        cls._orig_password_hash_method = server._PASSWORD_HASH_METHOD
+        cls._temp_dir = tempfile.TemporaryDirectory()
+        server._AUTH_STORE_PATH = Path(cls._temp_dir.name) / "auth_accounts.json"
+        server._PASSWORD_HASH_METHOD = "pbkdf2:sha256:1000"
+
+    @classmethod
+    def tearDownClass(cls):
+        server._AUTH_STORE_PATH = cls._orig_auth_store_path
+        server.crm._client = cls._orig_crm_client
+        server._PASSWORD_HASH_METHOD = cls._orig_password_hash_method
+        cls._temp_dir.cleanup()
+
+    def setUp(self):
+        server._AUTH_SESSIONS.clear()
+        server._upsert_auth_account(
+            {
+                "email": "member@example.org",
+                "full_name": "Member User",
+                "role": "member",
+                "status": "active",
+                "password": "MemberPass123",
+            }
+        )
+        self.client = server.app.test_client()
+        login_resp = self.client.post(
+            "/api/auth/login",
+            json={"email": "member@example.org", "password": "MemberPass123"},
+        )
+        self.assertEqual(login_resp.status_code, 200)
+
+    def tearDown(self):
+        server.crm._client = lambda: None
+        server.crm._DATA_SOURCE = None  # memoized per env, so drop the fake client's "supabase" answer
+
+    def _use_client(self, fake):
+        server.crm._client = lambda: fake
+        return fake
+
+    def test_bulk_create_inserts_all_records_in_one_request(self):
+        fake = self._use_client(_FakeClient())
+        resp = self.client.post("/api/campaigns/bulk", json={"records": [{"name": "Spring"}, {"name": "Fall"}]})
+        self.assertEqual(resp.status_code, 201)
+        payload = resp.get_json() or {}
+        self.assertEqual(payload.get("created_count"), 2)
+        self.assertEqual([c["id"] for c in payload["campaigns"]], ["campaigns-0", "campaigns-1"])
+        self.assertEqual(len(fake.inserts), 1)
+
+    def test_failed_insert_is_reported_not_mocked(self):
+        self._use_client(_FakeClient(error=RuntimeError("insert rejected")))
+        resp = self.client.post("/api/campaigns/bulk", json={"records": [{"name": "Spring"}, {"name": "Fall"}]})
+        self.assertEqual(resp.status_code, 400)
+        self.assertNotIn("campaigns", resp.get_json() or {})
+
+    def test_short_insert_response_is_an_error(self):
+        self._use_client(_FakeClient(return_limit=1))
+        resp = self.client.post("/api/campaigns/bulk", json={"records": [{"name": "Spring"}, {"name": "Fall"}]})
+        self.assertEqual(resp.status_code, 400)
+
+    def test_rejects_more_than_the_record_limit(self):
+        fake = self._use_client(_FakeClient())
+        records = [{"name": f"Campaign {i}"} for i in range(server._BULK_CREATE_MAX_RECORDS + 1)]
+        resp = self.client.post("/api/campaigns/bulk", json={"records": records})
+        self.assertEqual(resp.status_code, 400)
+        self.assertEqual(fake.inserts, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
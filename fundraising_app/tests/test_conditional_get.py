@@ -0,0 +1,98 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from fundraising_app import server
+
+
+def _clear_rate_limit_buckets():
+    # Logins and public submissions are rate limited per client, and every test client shares one address.
+    for _, buckets in server._RATE_LIMIT_STRIPES:
+        buckets.clear()
+
+
+class ConditionalGetTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._orig_auth_store_path = server._AUTH_STORE_PATH
+        cls._orig_crm_client = server.crm._client
+        cls._orig_password_hash_method = server._PASSWORD_HASH_METHOD
+        cls._temp_dir = tempfile.TemporaryDirectory()
+        server._AUTH_STORE_PATH = Path(cls._temp_dir.name) / "auth_accounts.json"
+        server.crm._client = lambda: None
+        server._PASSWORD_HASH_METHOD = "pbkdf2:sha256:1000"
+
+    @classmethod
+    def tearDownClass(cls):
+        server._AUTH_STORE_PATH = cls._orig_auth_store_path
+        server.crm._client = cls._orig_crm_client
+        server._PASSWORD_HASH_METHOD = cls._orig_password_hash_method
+        cls._temp_dir.cleanup()
+
+    def setUp(self):
+        server._AUTH_SESSIONS.clear()
+        _clear_rate_limit_buckets()
+        self.client = server.app.test_client()
+
+    def _member_client(self):
+        server._upsert_auth_account(
+            {
+                "email": "member@example.org",
+                "full_name": "Member User",
+                "role": "member",
+                "status": "active",
+                "password": "MemberPass123",
+            }
+        )
+        member_client = server.app.test_client()
+        login_resp = member_client.post(
+            "/api/auth/login",
+            json={"email": "member@example.org", "password": "MemberPass123"},
+        )
+        self.assertEqual(login_resp.status_code, 200)
+        return member_client
+
+    def test_matching_if_none_match_returns_304(self):
+        first = self.client.get("/api/fundraising/total")
+        self.assertEqual(first.status_code, 200)
+        etag = first.headers.get("ETag")
+        self.assertTrue(etag)
+
+        repeat = self.client.get("/api/fundraising/total")
+        self.assertEqual(repeat.headers.get("ETag"), etag)
+
+        cached = self.client.get("/api/fundraising/total", headers={"If-None-Match": etag})
+        self.assertEqual(cached.status_code, 304)
+        self.assertEqual(cached.get_data(), b"")
+
+        stale = self.client.get("/api/fundraising/total", headers={"If-None-Match": '"not-the-etag"'})
+        self.assertEqual(stale.status_code, 200)
+
+    def test_responses_are_revalidated_by_default(self):
+        with patch.object(server, "_PUBLIC_API_CACHE_SECONDS", 0):
+            resp = self.client.get("/api/fundraising/total")
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(set(resp.headers["Cache-Control"].split(", ")), {"private", "no-cache"})
+
+    def test_public_routes_allow_shared_caching_when_configured(self):
+        with patch.object(server, "_PUBLIC_API_CACHE_SECONDS", 30):
+            resp = self.client.get("/api/fundraising/total")
+        self.assertEqual(resp.headers["Cache-Control"], "public, max-age=30, stale-while-revalidate=60")
+
+    def test_authenticated_routes_stay_private_when_public_caching_is_on(self):
+        member_client = self._member_client()
+        with patch.object(server, "_PUBLIC_API_CACHE_SECONDS", 30):
+            resp = member_client.get("/api/team")
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(set(resp.headers["Cache-Control"].split(", ")), {"private", "no-cache"})
+        self.assertTrue(resp.headers.get("ETag"))
+
+    def test_errors_are_not_tagged(self):
+        resp = self.client.get("/api/team")
+        self.assertEqual(resp.status_code, 401)
+        self.assertIsNone(resp.headers.get("ETag"))
+
+
+if __name__ == "__main__":
+    unittest.main()
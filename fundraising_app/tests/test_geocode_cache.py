@@ -0,0 +1,73 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from fundraising_app.scraper import utils
+
+
+def _nominatim_response(lat="39.7", lon="-104.9"):
+    return SimpleNamespace(
+        raise_for_status=lambda: None,
+        json=lambda: [{"lat": lat, "lon": lon, "display_name": "Denver, Colorado"}],
+    )
+
+
+class GeocodeCacheTests(unittest.TestCase):
+    def setUp(self):
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.cache_path = Path(self._temp_dir.name) / ".runtime_geocode_cache.json"
+        path_patch = patch.object(utils, "GEOCODE_CACHE_PATH", self.cache_path)
+        path_patch.start()
+        self.addCleanup(path_patch.stop)
+        utils._GEOCODE_CACHE = None
+        self.addCleanup(setattr, utils, "_GEOCODE_CACHE", None)
+
+    def tearDown(self):
+        self._temp_dir.cleanup()
+
+    def test_miss_fetches_and_persists_the_result(self):
+        with patch.object(utils.SESSION, "get", return_value=_nominatim_response()) as get:
+            result = utils.geocode_location("Denver, CO")
+        self.assertEqual(get.call_count, 1)
+        self.assertEqual((result["latitude"], result["longitude"]), (39.7, -104.9))
+        stored = json.loads(self.cache_path.read_text(encoding="utf-8"))
+        self.assertEqual(stored["denver, co"]["result"], result)
+        self.assertEqual(list(Path(self._temp_dir.name).glob("*.tmp")), [])
+
+    def test_hit_skips_the_request_and_survives_a_reload(self):
+        with patch.object(utils.SESSION, "get", return_value=_nominatim_response()):
+            utils.geocode_location("Denver, CO")
+        utils._GEOCODE_CACHE = None  # force a reload from disk, as a fresh run would
+        with patch.object(utils.SESSION, "get") as get:
+            result = utils.geocode_location("  denver,   co ")
+        get.assert_not_called()
+        self.assertEqual(result["display_name"], "Denver, Colorado")
+
+    def test_expired_entries_are_refetched(self):
+        with patch.object(utils.SESSION, "get", return_value=_nominatim_response()):
+            utils.geocode_location("Denver, CO")
+        later = utils.time.time() + utils.GEOCODE_CACHE_TTL_SECONDS + 60
+        with patch.object(utils.time, "time", return_value=later), \
+                patch.object(utils.SESSION, "get", return_value=_nominatim_response(lat="40.0")) as get:
+            result = utils.geocode_location("Denver, CO")
+        self.assertEqual(get.call_count, 1)
+        self.assertEqual(result["latitude"], 40.0)
+        stored = json.loads(self.cache_path.read_text(encoding="utf-8"))
+        self.assertEqual(stored["denver, co"]["cached_at"], later)
+
+    def test_failed_write_keeps_the_previous_file(self):
+        with patch.object(utils.SESSION, "get", return_value=_nominatim_response()):
+            utils.geocode_location("Denver, CO")
+        before = self.cache_path.read_text(encoding="utf-8")
+        with patch.object(utils.SESSION, "get", return_value=_nominatim_response()), \
+                patch.object(utils.os, "replace", side_effect=OSError("disk full")):
+            self.assertIsNotNone(utils.geocode_location("Boulder, CO"))
+        self.assertEqual(self.cache_path.read_text(encoding="utf-8"), before)
+        self.assertEqual(list(Path(self._temp_dir.name).glob("*.tmp")), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
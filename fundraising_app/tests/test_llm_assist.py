@@ -0,0 +1,34 @@
+import os
+import unittest
+from unittest.mock import patch
+
+from fundraising_app.scraper import llm_assist
+
+
+class LlmConfigTests(unittest.TestCase):
+    def tearDown(self):
+        llm_assist.reload_config()
+
+    def test_reload_config_picks_up_environment_changes(self):
+        with patch.dict(
+            os.environ,
+            {
+                "OPENAI_API_KEY": "test-key",
+                "OPENAI_API_BASE": "https://llm.example.org/v1/",
+                "DISCOVERY_LLM_TIMEOUT_SECONDS": "3.5",
+            },
+        ):
+            llm_assist.reload_config()
+            self.assertTrue(llm_assist.llm_enabled())
+            self.assertEqual(llm_assist._LLM.api_key, "test-key")
+            self.assertEqual(llm_assist._LLM.base, "https://llm.example.org/v1")
+            self.assertEqual(llm_assist._LLM.timeout, 3.5)
+
+    def test_reload_config_disables_llm_without_api_key(self):
+        with patch.dict(os.environ, {"OPENAI_API_KEY": ""}):
+            llm_assist.reload_config()
+            self.assertFalse(llm_assist.llm_enabled())
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,73 @@
+import unittest
+from unittest.mock import patch
+
+from fundraising_app import server
+
+
+def _clear_rate_limit_buckets():
+    for _, buckets in server._RATE_LIMIT_STRIPES:
+        buckets.clear()
+    server._RATE_LIMIT_STRIPES_SWEPT_AT[:] = [0.0] * server._RATE_LIMIT_STRIPE_COUNT
+
+
+def _same_stripe_key(bucket: str) -> str:
+    stripe = hash(bucket) % server._RATE_LIMIT_STRIPE_COUNT
+    return next(
+        key for key in (f"other-{i}" for i in range(10000))
+        if hash(key) % server._RATE_LIMIT_STRIPE_COUNT == stripe
+    )
+
+
+class RateLimitTests(unittest.TestCase):
+    def setUp(self):
+        _clear_rate_limit_buckets()
+
+    def tearDown(self):
+        _clear_rate_limit_buckets()
+
+    def test_allows_burst_up_to_limit_then_blocks(self):
+        with patch.object(server, "_utc_now_ts", return_value=1000.0):
+            results = [server._rate_limit_allow("test", limit=3, window_seconds=60) for _ in range(4)]
+        self.assertEqual(results, [True, True, True, False])
+
+    def test_tokens_refill_over_the_window(self):
+        with patch.object(server, "_utc_now_ts", return_value=1000.0):
+            for _ in range(3):
+                server._rate_limit_allow("test", limit=3, window_seconds=60)
+            self.assertFalse(server._rate_limit_allow("test", limit=3, window_seconds=60))
+        # One token refills every window_seconds / limit seconds.
+        with patch.object(server, "_utc_now_ts", return_value=1020.0):
+            self.assertTrue(server._rate_limit_allow("test", limit=3, window_seconds=60))
+            self.assertFalse(server._rate_limit_allow("test", limit=3, window_seconds=60))
+
+    def test_buckets_are_independent(self):
+        with patch.object(server, "_utc_now_ts", return_value=1000.0):
+            self.assertTrue(server._rate_limit_allow("a", limit=1, window_seconds=60))
+            self.assertFalse(server._rate_limit_allow("a", limit=1, window_seconds=60))
+            self.assertTrue(server._rate_limit_allow("b", limit=1, window_seconds=60))
+
+    def test_explicit_now_overrides_the_clock(self):
+        with patch.object(server, "_utc_now_ts", return_value=5000.0):
+            self.assertTrue(server._rate_limit_allow("test", limit=1, window_seconds=60, now=1000.0))
+            self.assertFalse(server._rate_limit_allow("test", limit=1, window_seconds=60, now=1000.0))
+            # The clock default (5000.0) is well past the refill time of the 1000.0 reading.
+            self.assertTrue(server._rate_limit_allow("test", limit=1, window_seconds=60))
+
+    def test_refilled_buckets_are_swept(self):
+        other = _same_stripe_key("idle")
+        with patch.object(server, "_utc_now_ts", return_value=1000.0):
+            server._rate_limit_allow("idle", limit=3, window_seconds=60)
+            server._rate_limit_allow("busy", limit=1, window_seconds=3600)
+        # "idle" is full again after 20s; the next access to its stripe after the sweep interval drops it.
+        with patch.object(server, "_utc_now_ts", return_value=1000.0 + server._STATE_SWEEP_INTERVAL_SECONDS):
+            server._rate_limit_allow(other, limit=3, window_seconds=60)
+        stripe = server._RATE_LIMIT_STRIPES[hash("idle") % server._RATE_LIMIT_STRIPE_COUNT][1]
+        self.assertNotIn("idle", stripe)
+        self.assertIn(other, stripe)
+        # A bucket that is still refilling is kept, so its limit still applies.
+        with patch.object(server, "_utc_now_ts", return_value=1000.0 + server._STATE_SWEEP_INTERVAL_SECONDS):
+            self.assertFalse(server._rate_limit_allow("busy", limit=1, window_seconds=3600))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from fundraising_app import server
+
+
+def _read_lines(path: Path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+class RuntimeRecordsTests(unittest.TestCase):
+    def setUp(self):
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self._temp_dir.name) / ".runtime_help_requests.jsonl"
+
+    def tearDown(self):
+        self._temp_dir.cleanup()
+
+    def test_appends_one_json_line_per_record(self):
+        server._append_runtime_record(self.path, {"id": "a"})
+        server._append_runtime_record(self.path, {"id": "b"})
+        self.assertEqual([r["id"] for r in _read_lines(self.path)], ["a", "b"])
+
+    def test_legacy_json_list_is_converted_on_first_append(self):
+        legacy_path = self.path.with_suffix(".json")
+        legacy_path.write_text(json.dumps([{"id": "newer"}, {"id": "older"}]), encoding="utf-8")
+
+        server._append_runtime_record(self.path, {"id": "new"})
+
+        self.assertEqual([r["id"] for r in _read_lines(self.path)], ["older", "newer", "new"])
+        self.assertFalse(legacy_path.exists())
+        self.assertTrue(legacy_path.with_name(legacy_path.name + ".migrated").exists())
+
+    def test_compaction_keeps_newest_records(self):
+        with patch.object(server, "_RUNTIME_RECORDS_COMPACT_BYTES", 60), patch.object(server, "_RUNTIME_RECORDS_KEEP", 3):
+            for i in range(20):
+                server._append_runtime_record(self.path, {"id": i})
+        ids = [r["id"] for r in _read_lines(self.path)]
+        self.assertEqual(ids[-1], 19)
+        self.assertLess(len(ids), 20)
+        self.assertEqual(ids, sorted(ids))
+        self.assertEqual(list(Path(self._temp_dir.name).glob("*.tmp")), [])
+
+    def test_failed_compaction_leaves_existing_records_intact(self):
+        server._append_runtime_record(self.path, {"id": "kept"})
+        with patch.object(server, "_RUNTIME_RECORDS_COMPACT_BYTES", 1), \
+                patch.object(server.os, "replace", side_effect=OSError("disk full")), \
+                self.assertLogs(server.app.logger, level="ERROR"):
+            server._append_runtime_record(self.path, {"id": "also-kept"})
+        self.assertEqual([r["id"] for r in _read_lines(self.path)], ["kept", "also-kept"])
+        self.assertEqual(list(Path(self._temp_dir.name).glob("*.tmp")), [])
+
+
+if __name__ == "__main__":
+    unittest.main()